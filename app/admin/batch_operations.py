@@ -35,10 +35,9 @@ def batch_adjust_points(
     """
     ps = PointsService(db)
     
-    # Get target users
+    # Get target users (one IN-query instead of a SELECT per id)
     if user_ids:
-        users = [db.get(User, uid) for uid in user_ids]
-        users = [u for u in users if u is not None]
+        users = list(db.scalars(select(User).where(User.id.in_(user_ids))))
     else:
         users = list(db.scalars(select(User)))
     
@@ -90,10 +89,9 @@ def batch_adjust_xp(
     """
     xs = XpService(db, settings)
     
-    # Get target users
+    # Get target users (one IN-query instead of a SELECT per id)
     if user_ids:
-        users = [db.get(User, uid) for uid in user_ids]
-        users = [u for u in users if u is not None]
+        users = list(db.scalars(select(User).where(User.id.in_(user_ids))))
     else:
         users = list(db.scalars(select(User)))
     
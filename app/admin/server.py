@@ -23,11 +23,12 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
-from app.core.joystick_oauth import exchange_code_for_token, refresh_access_token
+from app.core.joystick_oauth import close_oauth, exchange_code_for_token, refresh_access_token
 from app.core.db import SessionLocal, bootstrap
 from app.core.items import ItemsService
 from app.core.models import QueueItem, Redeem, User, XP, JoystickInstall
 from app.core.overlay_bus import OverlayBus
+from app.core.pixel import close_pplx
 from app.core.points import PointsService
 from app.core.queue import QueueService
 from app.core.redeems import RedeemsService
@@ -678,8 +679,8 @@ def create_app(settings: Settings) -> FastAPI:
         q_channel = (qp.get("channelId") or qp.get("channel_id") or "").strip()
         q_streamer = (qp.get("streamer") or qp.get("username") or "").strip()
 
-        # Exchange code -> tokens (blocking IO done in a thread)
-        token = await asyncio.to_thread(exchange_code_for_token, settings, code, state=state or None)
+        # Exchange code -> tokens (async, pooled connection)
+        token = await exchange_code_for_token(settings, code, state=state or None)
 
         # Determine channel id with fallbacks
         cid = (
@@ -897,7 +898,7 @@ def create_app(settings: Settings) -> FastAPI:
         with SessionLocal() as db:
             # Award XP
             xs = XpService(db, settings)
-            xs.handle_event(XpEvent(type="follow", user=user, metadata={}, source="joystick"))
+            xs.handle_event(XpEvent(type="follow", user=user, source="joystick"))
             
             # NEW: Award POINTS
             if getattr(settings, 'POINTS_ENABLED', True):
@@ -947,7 +948,7 @@ def create_app(settings: Settings) -> FastAPI:
         with SessionLocal() as db:
             # Award XP
             xs = XpService(db, settings)
-            xs.handle_event(XpEvent(type="dropin", user=user, metadata={}, source="joystick"))
+            xs.handle_event(XpEvent(type="dropin", user=user, source="joystick"))
             
             # NEW: Award POINTS
             if getattr(settings, 'POINTS_ENABLED', True):
@@ -1011,6 +1012,8 @@ def create_app(settings: Settings) -> FastAPI:
             await _js.stop()
         if _worker:
             _worker.stop()
+        await close_pplx()
+        await close_oauth()
 
     app.include_router(admin)
 
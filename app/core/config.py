@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,6 +13,10 @@ class Settings(BaseSettings):
     # Admin security (optional)
     ADMIN_TOKEN: str = ""
 
+    # Skip DB table creation/migrations at startup (fast boots against a
+    # known-good database)
+    DB_BOOTSTRAP: bool = True
+
     # Media / Overlay
     SOUNDS_DIR: str = "./sounds"
 
@@ -116,3 +121,9 @@ class Settings(BaseSettings):
     @property
     def sounds_path(self) -> Path:
         return Path(self.SOUNDS_DIR).resolve()
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Shared Settings instance; parsing .env once per process is enough."""
+    return Settings()
@@ -97,7 +97,7 @@ class QueueWorker:
             path = self.settings.sounds_path / filename
             if not path.exists() or not path.is_file():
                 raise FileNotFoundError(f'sound file not found on server: {filename}')
-            await play_sfx(self.bus, filename)
+            play_sfx(self.bus, filename)
             return
 
         if kind == 'pixel':
@@ -154,7 +154,7 @@ class QueueWorker:
 
             # (2) Start one‑shot start SFX
             try:
-                await play_sfx(self.bus, self.settings.WHEEL_SFX_START)
+                play_sfx(self.bus, self.settings.WHEEL_SFX_START)
             except Exception:
                 pass
 
@@ -163,7 +163,7 @@ class QueueWorker:
 
             # (4) Start loop + rain visuals
             try:
-                await loop_start(self.bus, f"/media/sounds/{self.settings.WHEEL_SFX_LOOP}")
+                loop_start(self.bus, f"/media/sounds/{self.settings.WHEEL_SFX_LOOP}")
             except Exception:
                 pass
 
@@ -184,12 +184,12 @@ class QueueWorker:
                 pass
 
             try:
-                await loop_stop(self.bus)
+                loop_stop(self.bus)
             except Exception:
                 pass
 
             try:
-                await play_sfx(self.bus, self.settings.WHEEL_SFX_WIN)
+                play_sfx(self.bus, self.settings.WHEEL_SFX_WIN)
             except Exception:
                 pass
 
@@ -21,7 +21,7 @@ class CooldownService:
         remaining = (cd.expires_at - now).total_seconds()
         return True, remaining
 
-    def set(self, user_id: int, command: str, seconds: int) -> None:
+    def set(self, user_id: int, command: str, seconds: int, *, commit_now: bool = True) -> None:
         now = datetime.utcnow()
         expires = now + timedelta(seconds=seconds)
         # Upsert behavior
@@ -30,4 +30,5 @@ class CooldownService:
             cd.expires_at = expires
         else:
             self.db.add(Cooldown(user_id=user_id, command=command, expires_at=expires))
-        self.db.commit()
\ No newline at end of file
+        if commit_now:
+            self.db.commit()
\ No newline at end of file
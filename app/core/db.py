@@ -44,3 +44,8 @@ def bootstrap() -> None:
     # Lightweight migrations for additive schema changes (safe for existing DBs)
     with engine.connect() as conn:
         _ensure_column(conn, "redeems", "cooldown_s", "cooldown_s INTEGER NOT NULL DEFAULT 0")
+        # create_all only builds indexes for brand-new tables
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tx_user_id_desc ON transactions (user_id, id)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_queue_pending ON queue (kind) WHERE status = 'pending'"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_queue_kind_status_id ON queue (kind, status, id)"))
+        conn.commit()
@@ -29,9 +29,9 @@ class SfxPlayHandler(EffectHandler):
             except ValueError as e:
                 raise EffectValidationError(f"Invalid sound: {e}")
 
-        # Play the sound
+        # Play the sound (scheduled fire-and-forget)
         from app.core.sfx import play_sfx
-        await play_sfx(ctx.bus, str(sound))
+        play_sfx(ctx.bus, str(sound))
 
         return EffectResult(
             ok=True,
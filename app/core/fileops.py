@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -43,7 +44,20 @@ def make_backup(src: Path, backups_dir: Path, prefix: str) -> BackupInfo:
 def list_backups(backups_dir: Path, prefix: str) -> list[BackupInfo]:
     if not backups_dir.exists():
         return []
-    out: list[BackupInfo] = []
-    for p in sorted(backups_dir.glob(f"{prefix}_*.bak"), reverse=True):
-        out.append(BackupInfo(name=p.name, path=p, created_at_utc=datetime.utcfromtimestamp(p.stat().st_mtime).isoformat() + "Z"))
-    return out
+    # One scandir pass with string matching instead of a glob walk; the
+    # DirEntry stat comes from the directory read, not a syscall per file.
+    head = f"{prefix}_"
+    entries: list[tuple[str, float]] = []
+    with os.scandir(backups_dir) as it:
+        for e in it:
+            if e.name.startswith(head) and e.name.endswith(".bak") and e.is_file():
+                entries.append((e.name, e.stat().st_mtime))
+    entries.sort(reverse=True)
+    return [
+        BackupInfo(
+            name=name,
+            path=backups_dir / name,
+            created_at_utc=datetime.utcfromtimestamp(mtime).isoformat() + "Z",
+        )
+        for name, mtime in entries
+    ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from sqlalchemy import select
+from typing import Iterable
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.models import Item, Inventory
@@ -54,6 +56,67 @@ class ItemsService:
         self.db.commit()
         return inv
 
+    def grant_items_bulk(
+        self,
+        user_id: int,
+        items: dict[str, int] | Iterable[tuple[str, int]],
+        *,
+        commit_now: bool = True,
+    ) -> None:
+        """Grant several items in one upsert statement.
+
+        Accepts a mapping or (key, qty) pairs (as stored on LevelReward).
+        Equivalent to calling grant_item per key, but issues a single
+        INSERT ... ON CONFLICT(user_id, item_key) DO UPDATE instead of one
+        SELECT+write round trip per item. Zero quantities are skipped and
+        balances never go below zero (same clamping as grant_item).
+        """
+        pairs = items.items() if isinstance(items, dict) else (items or ())
+        wanted: dict[str, int] = {}
+        for key, qty in pairs:
+            k = (str(key) or "").strip().lower()
+            q = int(qty)
+            if k and q != 0:
+                wanted[k] = wanted.get(k, 0) + q
+        if not wanted:
+            return
+
+        # Ensure item definitions exist ("implicit" items, as in grant_item)
+        existing = set(self.db.scalars(select(Item.key).where(Item.key.in_(wanted))))
+        missing = [k for k in wanted if k not in existing]
+        if missing:
+            self.db.execute(
+                sqlite_insert(Item)
+                .values([{"key": k, "name": k, "description": "", "enabled": True} for k in missing])
+                .on_conflict_do_nothing(index_elements=["key"])
+            )
+
+        # Insert raw deltas so the conflict branch sees the true adjustment,
+        # then clamp: the update path clamps in SQL, fresh inserts of negative
+        # deltas are zeroed in a follow-up touching only those rows.
+        stmt = sqlite_insert(Inventory).values(
+            [{"user_id": user_id, "item_key": k, "qty": q} for k, q in wanted.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "item_key"],
+            set_={"qty": func.max(0, Inventory.qty + stmt.excluded.qty)},
+        )
+        self.db.execute(stmt)
+
+        negative = [k for k, q in wanted.items() if q < 0]
+        if negative:
+            self.db.execute(
+                Inventory.__table__.update()
+                .where(
+                    Inventory.user_id == user_id,
+                    Inventory.item_key.in_(negative),
+                    Inventory.qty < 0,
+                )
+                .values(qty=0)
+            )
+        if commit_now:
+            self.db.commit()
+
     def get_inventory(self, user_id: int) -> list[Inventory]:
         return list(
             self.db.scalars(
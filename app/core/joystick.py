@@ -31,27 +31,32 @@ class JoystickCallbacks:
     on_dropin: Optional[OnDropIn] = None
 
 
-class JoystickClient:
-    """Joystick gateway client (ActionCable).
+class JoystickGateway:
+    """Shared Joystick gateway connection (ActionCable).
+
+    One process may host several installs; every `JoystickClient` created with
+    the same basic key shares a single socket and a single read task here, so N
+    installs cost one TCP+TLS handshake instead of N. Incoming events are
+    demuxed on `channelId`: callbacks registered for that channel get the
+    event, with clients registered without a specific channel acting as the
+    catch-all route.
+    """
 
-    - Connects to wss://joystick.tv/cable?token=<BASIC_KEY>
-    - Subscribes to GatewayChannel
-    - Dispatches incoming events to callbacks
-    - Can send chat messages and whispers via ActionCable "message" commands
+    _shared: dict[str, "JoystickGateway"] = {}
 
-    Notes:
-    - Incoming events include a `channelId`. We keep the callbacks as (user,text,etc) for stability.
-      For sending messages, we pick a channelId via:
-        1) explicit parameter,
-        2) settings default channel id (stored outside here),
-        3) first installed channel in DB.
-    """
+    @classmethod
+    def shared(cls, basic_key: str) -> "JoystickGateway":
+        key = (basic_key or "").strip()
+        gw = cls._shared.get(key)
+        if gw is None:
+            gw = cls._shared[key] = cls(key)
+        return gw
 
-    def __init__(self, basic_key: str, *, default_channel_id: str = "") -> None:
+    def __init__(self, basic_key: str) -> None:
         self.basic_key = (basic_key or "").strip()
-        self.default_channel_id = (default_channel_id or "").strip()
 
-        self._cbs: JoystickCallbacks = JoystickCallbacks()
+        # channel_id -> callbacks; "" is the catch-all route.
+        self._routes: dict[str, JoystickCallbacks] = {}
         self._stop = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
 
@@ -65,70 +70,39 @@ class JoystickClient:
         # reconnect backoff
         self._backoff_s = 1.0
 
-    def set_callbacks(self, cbs: JoystickCallbacks) -> None:
-        self._cbs = cbs
+    # --------------------------
+    # Registration (per install)
+    # --------------------------
+    def register(self, channel_id: str, cbs: JoystickCallbacks) -> None:
+        self._routes[(channel_id or "").strip()] = cbs
 
-    async def start(self) -> None:
-        self._stop.clear()
-        self._task = asyncio.create_task(self._run())
+    async def deregister(self, channel_id: str) -> None:
+        self._routes.pop((channel_id or "").strip(), None)
+        if not self._routes:
+            await self._shutdown()
 
-    async def stop(self) -> None:
+    async def ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def _shutdown(self) -> None:
         self._stop.set()
         if self._task:
             await self._task
             self._task = None
 
+    def _route_for(self, channel_id: Optional[str]) -> JoystickCallbacks | None:
+        if channel_id:
+            cbs = self._routes.get(channel_id)
+            if cbs is not None:
+                return cbs
+        return self._routes.get("")
+
     # --------------------------
     # Outgoing (send to Joystick)
     # --------------------------
-    async def send_message(self, text: str, *, channel_id: str | None = None) -> None:
-        cid = await self._resolve_channel_id(channel_id)
-        if not cid:
-            # No installed channel yet; keep the bot stable.
-            print("[joystick] No channel_id available for send_message")
-            return
-        await self._send_action(
-            {
-                "action": "send_message",
-                "text": str(text),
-                "channelId": cid,
-            }
-        )
-
-    async def send_whisper(self, username: str, text: str, *, channel_id: str | None = None) -> None:
-        cid = await self._resolve_channel_id(channel_id)
-        if not cid:
-            print("[joystick] No channel_id available for send_whisper")
-            return
-        await self._send_action(
-            {
-                "action": "send_whisper",
-                "username": str(username),
-                "text": str(text),
-                "channelId": cid,
-            }
-        )
-
-    async def send_chat(self, text: str) -> None:
-        """Backward-compatible helper used by older code paths."""
-        await self.send_message(text)
-
-    async def _resolve_channel_id(self, explicit: str | None) -> str:
-        if explicit:
-            return str(explicit).strip()
-        if self.default_channel_id:
-            return self.default_channel_id
-        if self._last_seen_channel_id:
-            return self._last_seen_channel_id
-
-        # Fall back to first installation in DB
-        with SessionLocal() as db:
-            inst = db.scalar(select(JoystickInstall).order_by(JoystickInstall.updated_at.desc()))
-            if inst and inst.channel_id:
-                return inst.channel_id
-        return ""
-
-    async def _send_action(self, action_payload: dict) -> None:
+    async def send_action(self, action_payload: dict) -> None:
         ws = self._ws
         if not ws:
             print("[joystick] Cannot send action (not connected)")
@@ -164,24 +138,6 @@ class JoystickClient:
             self._ws = None
             return
 
-    # --------------------------
-    # Dev/Sim helpers (work in ALL modes)
-    # --------------------------
-    async def sim_push_chat(self, user: str, text: str) -> None:
-        await self._dispatch('chat', { 'user': user, 'text': text })
-
-    async def sim_push_follow(self, user: str) -> None:
-        await self._dispatch('follow', { 'user': user })
-
-    async def sim_push_sub(self, user: str, months: int) -> None:
-        await self._dispatch('sub', { 'user': user, 'months': months })
-
-    async def sim_push_tip(self, user: str, tokens: int) -> None:
-        await self._dispatch('tip', { 'user': user, 'tokens': tokens })
-
-    async def sim_push_dropin(self, user: str) -> None:
-        await self._dispatch('dropin', { 'user': user })
-
     # --------------------------
     # Internal loop
     # --------------------------
@@ -274,6 +230,11 @@ class JoystickClient:
         if isinstance(ch, str) and ch:
             self._last_seen_channel_id = ch
 
+        # Route to the install registered for this channel (or the catch-all).
+        cbs = self._route_for(self._last_seen_channel_id)
+        if cbs is None:
+            return
+
         # Joystick's gateway messages put the high-level kind in `event`.
         # `type` is used for sub-types (e.g. ChatMessage: new_message, UserPresence: enter_stream, StreamEvent: Tipped).
         event = (msg.get("event") or "").strip()
@@ -305,7 +266,7 @@ class JoystickClient:
                     text = str(t)
 
             if user or text:
-                await self._dispatch("chat", {"user": str(user), "text": str(text)})
+                await self._dispatch_chat(cbs, str(user), str(text))
             return
 
         if ev in ("userpresence","user_presence"):
@@ -319,7 +280,7 @@ class JoystickClient:
                 payload = msg.get("payload") or {}
                 user = payload.get("username") or payload.get("user") or ""
             if ptype == "enter_stream":
-                await self._dispatch("dropin", {"user": user})
+                await self._dispatch_dropin(cbs, user)
             return
 
         if ev in ("streamevent","stream_event"):
@@ -348,7 +309,7 @@ class JoystickClient:
                 user = payload.get("username") or payload.get("user") or ""
 
             if "follow" in stype_l:
-                await self._dispatch("follow", {"user": user})
+                await self._dispatch_follow(cbs, user)
                 return
 
             if "sub" in stype_l or "subscriber" in stype_l or "gift" in stype_l:
@@ -358,7 +319,7 @@ class JoystickClient:
                         months = int(meta.get("months") or 1)
                     except Exception:
                         months = 1
-                await self._dispatch("sub", {"user": user, "months": months})
+                await self._dispatch_sub(cbs, user, months)
                 return
 
             if "tip" in stype_l or "tipped" in stype_l:
@@ -368,22 +329,158 @@ class JoystickClient:
                         tokens = int(meta.get("how_much") or meta.get("tokens") or meta.get("amount") or 0)
                     except Exception:
                         tokens = 0
-                await self._dispatch("tip", {"user": user, "tokens": tokens})
+                await self._dispatch_tip(cbs, user, tokens)
                 return
             return
 
-    async def _dispatch(self, kind: str, payload: dict) -> None:
-        c = self._cbs
-        try:
-            if kind == "chat" and c.on_chat:
-                await c.on_chat(payload.get("user", ""), payload.get("text", ""))
-            elif kind == "follow" and c.on_follow:
-                await c.on_follow(payload.get("user", ""))
-            elif kind == "sub" and c.on_sub:
-                await c.on_sub(payload.get("user", ""), int(payload.get("months", 1)))
-            elif kind == "tip" and c.on_tip:
-                await c.on_tip(payload.get("user", ""), int(payload.get("tokens", 0)))
-            elif kind == "dropin" and c.on_dropin:
-                await c.on_dropin(payload.get("user", ""))
-        except Exception as e:
-            print(f"[joystick] callback error: {e}")
+    # Per-kind dispatchers take positional args directly; events are hot enough
+    # that we skip building an intermediate payload dict per event.
+    async def _dispatch_chat(self, cbs: JoystickCallbacks, user: str, text: str) -> None:
+        if cbs.on_chat:
+            try:
+                await cbs.on_chat(user, text)
+            except Exception as e:
+                print(f"[joystick] callback error: {e}")
+
+    async def _dispatch_follow(self, cbs: JoystickCallbacks, user: str) -> None:
+        if cbs.on_follow:
+            try:
+                await cbs.on_follow(user)
+            except Exception as e:
+                print(f"[joystick] callback error: {e}")
+
+    async def _dispatch_sub(self, cbs: JoystickCallbacks, user: str, months: int) -> None:
+        if cbs.on_sub:
+            try:
+                await cbs.on_sub(user, int(months))
+            except Exception as e:
+                print(f"[joystick] callback error: {e}")
+
+    async def _dispatch_tip(self, cbs: JoystickCallbacks, user: str, tokens: int) -> None:
+        if cbs.on_tip:
+            try:
+                await cbs.on_tip(user, int(tokens))
+            except Exception as e:
+                print(f"[joystick] callback error: {e}")
+
+    async def _dispatch_dropin(self, cbs: JoystickCallbacks, user: str) -> None:
+        if cbs.on_dropin:
+            try:
+                await cbs.on_dropin(user)
+            except Exception as e:
+                print(f"[joystick] callback error: {e}")
+
+
+class JoystickClient:
+    """Joystick gateway client (ActionCable).
+
+    Thin facade over the shared `JoystickGateway`:
+    - registers/deregisters this install's callbacks (demuxed on channelId)
+    - forwards sends (chat messages and whispers) over the shared socket
+
+    Notes:
+    - Incoming events include a `channelId`. We keep the callbacks as (user,text,etc) for stability.
+      For sending messages, we pick a channelId via:
+        1) explicit parameter,
+        2) settings default channel id (stored outside here),
+        3) first installed channel in DB.
+    """
+
+    def __init__(self, basic_key: str, *, default_channel_id: str = "") -> None:
+        self.basic_key = (basic_key or "").strip()
+        self.default_channel_id = (default_channel_id or "").strip()
+
+        self._cbs: JoystickCallbacks = JoystickCallbacks()
+        self._gateway = JoystickGateway.shared(self.basic_key)
+        self._registered = False
+
+    @property
+    def debug(self) -> bool:
+        return self._gateway.debug
+
+    @debug.setter
+    def debug(self, value: bool) -> None:
+        self._gateway.debug = bool(value)
+
+    def set_callbacks(self, cbs: JoystickCallbacks) -> None:
+        self._cbs = cbs
+        if self._registered:
+            self._gateway.register(self.default_channel_id, cbs)
+
+    async def start(self) -> None:
+        self._gateway.register(self.default_channel_id, self._cbs)
+        self._registered = True
+        await self._gateway.ensure_started()
+
+    async def stop(self) -> None:
+        if self._registered:
+            self._registered = False
+            await self._gateway.deregister(self.default_channel_id)
+
+    # --------------------------
+    # Outgoing (send to Joystick)
+    # --------------------------
+    async def send_message(self, text: str, *, channel_id: str | None = None) -> None:
+        cid = await self._resolve_channel_id(channel_id)
+        if not cid:
+            # No installed channel yet; keep the bot stable.
+            print("[joystick] No channel_id available for send_message")
+            return
+        await self._gateway.send_action(
+            {
+                "action": "send_message",
+                "text": str(text),
+                "channelId": cid,
+            }
+        )
+
+    async def send_whisper(self, username: str, text: str, *, channel_id: str | None = None) -> None:
+        cid = await self._resolve_channel_id(channel_id)
+        if not cid:
+            print("[joystick] No channel_id available for send_whisper")
+            return
+        await self._gateway.send_action(
+            {
+                "action": "send_whisper",
+                "username": str(username),
+                "text": str(text),
+                "channelId": cid,
+            }
+        )
+
+    async def send_chat(self, text: str) -> None:
+        """Backward-compatible helper used by older code paths."""
+        await self.send_message(text)
+
+    async def _resolve_channel_id(self, explicit: str | None) -> str:
+        if explicit:
+            return str(explicit).strip()
+        if self.default_channel_id:
+            return self.default_channel_id
+        if self._gateway._last_seen_channel_id:
+            return self._gateway._last_seen_channel_id
+
+        # Fall back to first installation in DB
+        with SessionLocal() as db:
+            inst = db.scalar(select(JoystickInstall).order_by(JoystickInstall.updated_at.desc()))
+            if inst and inst.channel_id:
+                return inst.channel_id
+        return ""
+
+    # --------------------------
+    # Dev/Sim helpers (work in ALL modes)
+    # --------------------------
+    async def sim_push_chat(self, user: str, text: str) -> None:
+        await self._gateway._dispatch_chat(self._cbs, user, text)
+
+    async def sim_push_follow(self, user: str) -> None:
+        await self._gateway._dispatch_follow(self._cbs, user)
+
+    async def sim_push_sub(self, user: str, months: int) -> None:
+        await self._gateway._dispatch_sub(self._cbs, user, months)
+
+    async def sim_push_tip(self, user: str, tokens: int) -> None:
+        await self._gateway._dispatch_tip(self._cbs, user, tokens)
+
+    async def sim_push_dropin(self, user: str) -> None:
+        await self._gateway._dispatch_dropin(self._cbs, user)
@@ -7,11 +7,16 @@ from datetime import datetime, timedelta
 from typing import Any
 
 import urllib.parse
-import urllib.request
-import urllib.error
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from app.core.config import Settings
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    _json = json
+
 TOKEN_URL = "https://joystick.tv/api/oauth/token"
 
 
@@ -66,30 +71,42 @@ def _basic_headers(settings: Settings) -> dict[str, str]:
     }
 
 
-def _post_form(url: str, params: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]:
+# Pooled keep-alive session: refreshes reuse the TLS connection, and the
+# token round-trip no longer blocks the event loop the way urlopen did.
+_session: ClientSession | None = None
+
+
+def _get_session() -> ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = ClientSession(connector=TCPConnector(limit=2, keepalive_timeout=60))
+    return _session
+
+
+async def close_oauth() -> None:
+    """Close the pooled session (call from the app shutdown hook)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def _post_form(url: str, params: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]:
+    # Per Joystick docs, token parameters ride in the query string.
     qs = urllib.parse.urlencode({k: str(v) for k, v in params.items() if v is not None})
-    req = urllib.request.Request(
-        url=f"{url}?{qs}",
-        method="POST",
-        headers=headers,
-    )
+    sess = _get_session()
+    async with sess.post(f"{url}?{qs}", headers=headers, timeout=ClientTimeout(total=20)) as resp:
+        body = await resp.read()
+        if resp.status >= 400:
+            err_body = body.decode("utf-8", errors="replace")
+            raise RuntimeError(f"Joystick token endpoint HTTP {resp.status}: {err_body or resp.reason}")
 
-    try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
-            if not body:
-                return {}
-            return json.loads(body)
-    except urllib.error.HTTPError as e:
-        err_body = ""
-        try:
-            err_body = e.read().decode("utf-8", errors="replace")
-        except Exception:
-            err_body = ""
-        raise RuntimeError(f"Joystick token endpoint HTTP {e.code}: {err_body or e.reason}") from e
+    if not body:
+        return {}
+    return _json.loads(body)
 
 
-def exchange_code_for_token(settings: Settings, code: str, *, state: str | None = None) -> OAuthToken:
+async def exchange_code_for_token(settings: Settings, code: str, *, state: str | None = None) -> OAuthToken:
     """Exchange authorization code for access+refresh tokens.
 
     Per Joystick docs:
@@ -106,7 +123,7 @@ def exchange_code_for_token(settings: Settings, code: str, *, state: str | None
     if state:
         headers["X-JOYSTICK-STATE"] = str(state)
 
-    data = _post_form(TOKEN_URL, payload, headers=headers)
+    data = await _post_form(TOKEN_URL, payload, headers=headers)
 
     return OAuthToken(
         access_token=str(data.get("access_token", "")),
@@ -116,7 +133,7 @@ def exchange_code_for_token(settings: Settings, code: str, *, state: str | None
     )
 
 
-def refresh_access_token(settings: Settings, refresh_token: str, *, state: str | None = None) -> OAuthToken:
+async def refresh_access_token(settings: Settings, refresh_token: str, *, state: str | None = None) -> OAuthToken:
     payload = {
         "refresh_token": refresh_token,
         "grant_type": "refresh_token",
@@ -126,7 +143,7 @@ def refresh_access_token(settings: Settings, refresh_token: str, *, state: str |
     if state:
         headers["X-JOYSTICK-STATE"] = str(state)
 
-    data = _post_form(TOKEN_URL, payload, headers=headers)
+    data = await _post_form(TOKEN_URL, payload, headers=headers)
 
     return OAuthToken(
         access_token=str(data.get("access_token", "")),
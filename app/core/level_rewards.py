@@ -1,21 +1,30 @@
 from __future__ import annotations
 
-import json
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from sqlalchemy.orm import Session
 
 from app.core.items import ItemsService
 from app.core.points import PointsService
 
+# orjson parses noticeably faster and takes bytes directly; fall back to the
+# stdlib so a missing optional dependency never breaks reward loading.
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
+
 
 @dataclass(frozen=True)
 class LevelReward:
     level: int
     points: int = 0
-    items: dict[str, int] | None = None
+    # (key, qty) pairs, pre-coerced and zero-filtered at parse time
+    items: tuple[tuple[str, int], ...] | None = None
     tts: str | None = None
 
 
@@ -29,8 +38,9 @@ def _parse_reward(obj: dict[str, Any]) -> LevelReward | None:
         if not isinstance(items, dict):
             items = None
         else:
-            # coerce qty to int
-            items = {str(k): int(v) for k, v in items.items()}
+            # coerce qty to int once here; zero-quantity entries never make it
+            # into the reward at all
+            items = tuple(sorted((str(k), int(v)) for k, v in items.items() if int(v) != 0)) or None
         tts = obj.get("tts")
         if tts is not None:
             tts = str(tts)
@@ -39,7 +49,7 @@ def _parse_reward(obj: dict[str, Any]) -> LevelReward | None:
         return None
 
 
-def load_level_rewards(path: str | Path) -> dict[int, LevelReward]:
+def load_level_rewards(path: str | Path) -> Mapping[int, LevelReward]:
     """Load level-up rewards from JSON.
 
     File format (list):
@@ -49,17 +59,30 @@ def load_level_rewards(path: str | Path) -> dict[int, LevelReward]:
       ]
 
     Missing file => empty rewards.
+
+    Results are cached per (path, mtime), so repeated level-ups don't re-read
+    and re-parse the file; editing the file invalidates the cache naturally.
     """
     p = Path(path)
-    if not p.exists():
-        return {}
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        return _EMPTY_REWARDS
+    return _load_cached(str(p), mtime_ns)
+
+
+_EMPTY_REWARDS: Mapping[int, LevelReward] = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime_ns: int) -> Mapping[int, LevelReward]:
+    try:
+        data = _json.loads(Path(path_str).read_bytes())
     except Exception:
-        return {}
+        return _EMPTY_REWARDS
 
     if not isinstance(data, list):
-        return {}
+        return _EMPTY_REWARDS
 
     out: dict[int, LevelReward] = {}
     for item in data:
@@ -69,7 +92,8 @@ def load_level_rewards(path: str | Path) -> dict[int, LevelReward]:
         if r is None:
             continue
         out[r.level] = r
-    return out
+    # Read-only view: cached mappings are shared between callers.
+    return MappingProxyType(out)
 
 
 def apply_level_rewards(
@@ -78,13 +102,15 @@ def apply_level_rewards(
     user_id: int,
     user_name: str,
     new_level: int,
-    rewards_path: str | Path,
+    rewards: Mapping[int, LevelReward],
 ) -> list[dict[str, Any]]:
     """Apply any reward for `new_level`.
 
+    `rewards` is a pre-parsed mapping from `load_level_rewards`; callers
+    crossing several levels load once and reuse it.
+
     Returns a list of applied actions for logging/debug.
     """
-    rewards = load_level_rewards(rewards_path)
     r = rewards.get(int(new_level))
     if r is None:
         return []
@@ -93,16 +119,17 @@ def apply_level_rewards(
 
     if int(r.points or 0) != 0:
         ps = PointsService(db)
-        new_bal = ps.grant(user_id, amount=int(r.points), reason=f"level_reward:{new_level}")
+        # Defer the commit: the caller (XpService._award) commits the whole
+        # level-up as one transaction.
+        new_bal = ps.grant(user_id, amount=int(r.points), reason=f"level_reward:{new_level}", commit_now=False)
         applied.append({"type": "points", "amount": int(r.points), "new_balance": int(new_bal)})
 
     if r.items:
         isvc = ItemsService(db)
-        for key, qty in r.items.items():
-            if int(qty) == 0:
-                continue
-            isvc.grant_item(user_id, str(key), qty=int(qty))
-            applied.append({"type": "item", "key": str(key), "qty": int(qty)})
+        # One upsert for all items instead of a statement per item.
+        isvc.grant_items_bulk(user_id, r.items, commit_now=False)
+        for key, qty in r.items:
+            applied.append({"type": "item", "key": key, "qty": qty})
 
     if r.tts:
         applied.append({"type": "tts", "text": r.tts.format(user=user_name, level=new_level)})
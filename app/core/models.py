@@ -2,7 +2,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.orm import declarative_base, Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, DateTime, ForeignKey, Boolean, JSON, UniqueConstraint
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Boolean, JSON, UniqueConstraint, Index, func, text
 
 Base = declarative_base()
 
@@ -11,11 +11,13 @@ class User(Base):
     __tablename__ = "users"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(80), unique=True, index=True)
-    first_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    last_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    first_seen: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    last_seen: Mapped[datetime] = mapped_column(DateTime, default=func.now())
 
-    points: Mapped["Points"] = relationship("Points", back_populates="user", uselist=False)
-    xp: Mapped[Optional["XP"]] = relationship("XP", back_populates="user", uselist=False)
+    # selectin: bulk user listings batch-fetch Points/XP with one IN-query
+    # instead of a lazy single-row select per user touched in templates.
+    points: Mapped["Points"] = relationship("Points", back_populates="user", uselist=False, lazy="selectin")
+    xp: Mapped[Optional["XP"]] = relationship("XP", back_populates="user", uselist=False, lazy="selectin")
 
 
 class Points(Base):
@@ -32,7 +34,11 @@ class Transaction(Base):
     type: Mapped[str] = mapped_column(String(32))  # grant|spend|refund|adjust
     delta: Mapped[int] = mapped_column(Integer)
     reason: Mapped[str] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+
+    # Serves the per-user history listing (WHERE user_id=? ORDER BY id DESC)
+    # without scanning the whole table.
+    __table_args__ = (Index("ix_tx_user_id_desc", "user_id", "id"),)
 
 
 class XP(Base):
@@ -50,7 +56,7 @@ class XPTransaction(Base):
     delta: Mapped[int] = mapped_column(Integer)
     reason: Mapped[str] = mapped_column(String(255), default="")
     source: Mapped[str] = mapped_column(String(40), default="")  # chat|follow|sub|tip|dropin|admin|reward
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
 
 
 class Redeem(Base):
@@ -61,8 +67,8 @@ class Redeem(Base):
     cost: Mapped[int] = mapped_column(Integer, default=0)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     cooldown_s: Mapped[int] = mapped_column(Integer, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
 
 class Item(Base):
@@ -73,8 +79,8 @@ class Item(Base):
     description: Mapped[str] = mapped_column(String(255), default="")
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     cooldown_s: Mapped[int] = mapped_column(Integer, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
 
 class Inventory(Base):
@@ -83,7 +89,7 @@ class Inventory(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     item_key: Mapped[str] = mapped_column(String(64), index=True)
     qty: Mapped[int] = mapped_column(Integer, default=0)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
     __table_args__ = (UniqueConstraint("user_id", "item_key", name="uq_user_item"),)
 
@@ -103,10 +109,19 @@ class QueueItem(Base):
     kind: Mapped[str] = mapped_column(String(40))  # e.g., tts, sfx, spin
     payload_json: Mapped[dict] = mapped_column(JSON)
     status: Mapped[str] = mapped_column(String(16), default="pending")  # pending|running|done|error
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
+    # Partial index: cap checks and worker polls only ever look at pending
+    # rows, so the index stays tiny no matter how much history accumulates.
+    # The (kind, status, id) index covers the FIFO ORDER BY id LIMIT 1 pulls
+    # (which also look at 'running') without a sort.
+    __table_args__ = (
+        Index("ix_queue_pending", "kind", sqlite_where=text("status = 'pending'")),
+        Index("ix_queue_kind_status_id", "kind", "status", "id"),
+    )
+
 
 class JoystickInstall(Base):
     __tablename__ = "joystick_installs"
@@ -123,5 +138,5 @@ class JoystickInstall(Base):
     refresh_token: Mapped[str] = mapped_column(String(255), default="")
     expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    installed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    installed_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
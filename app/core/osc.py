@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import socket
 import struct
 from dataclasses import dataclass
@@ -7,13 +8,22 @@ from typing import Any, Iterable
 from app.core.config import Settings
 
 
+# Prebound packers: a Struct object skips the per-call format parse.
+_INT32 = struct.Struct(">i")
+_FLOAT32 = struct.Struct(">f")
+_TIMETAG = struct.Struct(">Q")
+
+
 def _pad4(b: bytes) -> bytes:
     # OSC strings/blobs are padded with zero bytes to a 4-byte boundary
     pad = (-len(b)) % 4
     return b + (b"\x00" * pad)
 
 
+@functools.lru_cache(maxsize=512)
 def _osc_str(s: str) -> bytes:
+    # Pure function of its input; addresses/type tags repeat constantly
+    # (VRChat parameter paths are a small fixed set), so cache the encodings.
     return _pad4(s.encode("utf-8") + b"\x00")
 
 
@@ -34,6 +44,9 @@ class OSCService:
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # Lazily-created, reused UDP socket; creating one per burst costs two
+        # syscalls that dominate at avatar-parameter rates.
+        self._sock: socket.socket | None = None
 
     def enabled(self) -> bool:
         return bool(getattr(self.settings, "VRC_OSC_ENABLED", False))
@@ -49,44 +62,91 @@ class OSCService:
         msg = OscMessage(address=address, type=type_, value=value)
         self.send_many([msg])
 
+    def _get_sock(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            except OSError:
+                pass
+            self._sock = sock
+        return self._sock
+
     def send_many(self, messages: Iterable[OscMessage]) -> None:
         if not self.enabled():
             return
-        host, port = self._target()
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        try:
-            for m in messages:
-                pkt = build_osc_packet(m.address, m.type, m.value)
-                sock.sendto(pkt, (host, port))
-        finally:
-            try:
-                sock.close()
-            except Exception:
-                pass
+        addr = self._target()
+        sock = self._get_sock()
+        msgs = list(messages)
+        if len(msgs) > 1:
+            # Pack the burst into one #bundle datagram: one syscall, and the
+            # receiver applies the messages together.
+            sock.sendto(build_osc_bundle(msgs), addr)
+            return
+        for m in msgs:
+            pkt = build_osc_packet(m.address, m.type, m.value)
+            sock.sendto(pkt, addr)
+
+
+# Type dispatch table: one dict lookup per packet instead of chained string
+# comparisons. Each handler returns (padded type-tag bytes, argument bytes);
+# the tag literals are already OSC-padded so no _osc_str work per packet.
+# OSC bool uses 'T' or 'F' with no argument payload.
+def _osc_args_int(value: Any) -> tuple[bytes, bytes]:
+    return b",i\x00\x00", _INT32.pack(int(value))
+
+
+def _osc_args_float(value: Any) -> tuple[bytes, bytes]:
+    return b",f\x00\x00", _FLOAT32.pack(float(value))
+
+
+def _osc_args_str(value: Any) -> tuple[bytes, bytes]:
+    return b",s\x00\x00", _osc_str(str(value))
+
+
+def _osc_args_bool(value: Any) -> tuple[bytes, bytes]:
+    return (b",T\x00\x00" if value else b",F\x00\x00"), b""
+
+
+_TYPE_HANDLERS = {
+    "int": _osc_args_int, "i": _osc_args_int, "int32": _osc_args_int,
+    "float": _osc_args_float, "f": _osc_args_float, "float32": _osc_args_float,
+    "string": _osc_args_str, "s": _osc_args_str, "str": _osc_args_str,
+    "bool": _osc_args_bool, "b": _osc_args_bool, "boolean": _osc_args_bool,
+}
 
 
 def build_osc_packet(address: str, type_: str, value: Any) -> bytes:
     addr = (address or "").strip()
     if not addr.startswith("/"):
         raise ValueError("OSC address must start with '/'")
-    t = (type_ or "").strip().lower()
-
-    # Build type tags and arguments
-    if t in ("int", "i", "int32"):
-        tags = ",i"
-        args = struct.pack(">i", int(value))
-    elif t in ("float", "f", "float32"):
-        tags = ",f"
-        args = struct.pack(">f", float(value))
-    elif t in ("string", "s", "str"):
-        tags = ",s"
-        args = _osc_str(str(value))
-    elif t in ("bool", "b", "boolean"):
-        # OSC bool uses 'T' or 'F' with no argument payload
-        v = bool(value)
-        tags = ",T" if v else ",F"
-        args = b""
-    else:
+
+    handler = _TYPE_HANDLERS.get((type_ or "").strip().lower())
+    if handler is None:
         raise ValueError(f"Unsupported OSC type: {type_}")
+    tags, args = handler(value)
+
+    # Assemble into one pre-sized buffer rather than chained concatenations,
+    # which would materialize an intermediate bytes object per +.
+    head = _osc_str(addr)
+    n_head = len(head)
+    n_tags = len(tags)
+    buf = bytearray(n_head + n_tags + len(args))
+    buf[:n_head] = head
+    buf[n_head:n_head + n_tags] = tags
+    buf[n_head + n_tags:] = args
+    return bytes(buf)
+
 
-    return _osc_str(addr) + _osc_str(tags) + args
+def build_osc_bundle(messages: Iterable[OscMessage], timetag: int = 0) -> bytes:
+    """Pack several messages into one OSC #bundle.
+
+    Each element is a size-prefixed encoded message; timetag 0 means
+    "immediately" per the OSC spec.
+    """
+    parts = [_osc_str("#bundle"), _TIMETAG.pack(timetag)]
+    for m in messages:
+        pkt = build_osc_packet(m.address, m.type, m.value)
+        parts.append(_INT32.pack(len(pkt)))
+        parts.append(pkt)
+    return b"".join(parts)
@@ -1,5 +1,4 @@
 from __future__ import annotations
-from typing import Set
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import asyncio
 import json
@@ -7,31 +6,39 @@ import json
 
 class OverlayBus:
     def __init__(self) -> None:
-        self._clients: Set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        # Plain dict, no lock: membership changes are synchronous dict ops on
+        # the event loop, so there's nothing to guard — the old asyncio.Lock
+        # only added scheduling hops per broadcast.
+        self._clients: dict[int, WebSocket] = {}
+        # Immutable snapshot rebuilt on connect/disconnect so broadcast reads
+        # one attribute instead of copying the client table per message.
+        self._snapshot: tuple[WebSocket, ...] = ()
 
     async def connect(self, ws: WebSocket) -> None:
         await ws.accept()
-        async with self._lock:
-            self._clients.add(ws)
+        self._clients[id(ws)] = ws
+        self._snapshot = tuple(self._clients.values())
 
     async def disconnect(self, ws: WebSocket) -> None:
-        async with self._lock:
-            self._clients.discard(ws)
+        self._clients.pop(id(ws), None)
+        self._snapshot = tuple(self._clients.values())
 
     async def broadcast(self, message: dict) -> None:
-        async with self._lock:
-            targets = list(self._clients)
-        dead: list[WebSocket] = []
-        for ws in targets:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                dead.append(ws)
+        targets = self._snapshot
+        if not targets:
+            return
+        # Serialize once and fan out concurrently: send_json would re-run
+        # json.dumps per client, and awaiting sequentially lets one slow
+        # client hold up the rest. Text frames keep browser overlays happy.
+        payload = json.dumps(message)
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in targets), return_exceptions=True
+        )
+        dead = [ws for ws, r in zip(targets, results) if isinstance(r, BaseException)]
         if dead:
-            async with self._lock:
-                for ws in dead:
-                    self._clients.discard(ws)
+            for ws in dead:
+                self._clients.pop(id(ws), None)
+            self._snapshot = tuple(self._clients.values())
 
 
 def overlay_ws_router(bus: OverlayBus) -> APIRouter:
@@ -1,9 +1,16 @@
 from __future__ import annotations
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from app.core.config import Settings
 from app.core.text import clamp_reply
 
+# orjson parses responses faster and works on raw bytes; fall back to the
+# stdlib so a missing optional dependency never takes Pixel offline.
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
+
 PERSONA = (
     "You are Pixel, Lilani's playful android circus-announcer assistant. You're witty,"
     " very lewd but tasteful, and fun. Keep replies concise, be sexual."
@@ -13,6 +20,28 @@ PERSONA = (
 API_URL = "https://api.perplexity.ai/chat/completions"
 FALLBACK_MODEL = "sonar-small-chat"
 
+# Constant system message; no need to rebuild the dict per call.
+_SYS_MSG = {"role": "system", "content": PERSONA + " Keep answers under ~2 sentences."}
+
+# Shared keep-alive session: creating a ClientSession per call pays a fresh
+# TCP+TLS handshake to api.perplexity.ai every time.
+_session: ClientSession | None = None
+
+
+def _get_session() -> ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = ClientSession(connector=TCPConnector(limit=8, keepalive_timeout=60))
+    return _session
+
+
+async def close_pplx() -> None:
+    """Close the pooled session (call from the app shutdown hook)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
 
 async def _pplx_request(key: str, model: str, messages: list[dict], max_tokens: int, timeout_s: int):
     headers = {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
@@ -22,9 +51,11 @@ async def _pplx_request(key: str, model: str, messages: list[dict], max_tokens:
         "max_tokens": max(48, int(max_tokens)),
         "temperature": 0.8,
     }
-    async with ClientSession(timeout=ClientTimeout(total=max(5, int(timeout_s)))) as sess:
-        async with sess.post(API_URL, json=payload, headers=headers) as resp:
-            return resp.status, await resp.text()
+    sess = _get_session()
+    timeout = ClientTimeout(total=max(5, int(timeout_s)))
+    async with sess.post(API_URL, json=payload, headers=headers, timeout=timeout) as resp:
+        # Return raw bytes; orjson parses them without a decode round-trip.
+        return resp.status, await resp.read()
 
 
 async def call_perplexity(settings: Settings, prompt: str) -> str:
@@ -37,27 +68,25 @@ async def call_perplexity(settings: Settings, prompt: str) -> str:
     timeout_s  = int(settings.PPLX_TIMEOUT or 12)
 
     # Soft shortness hints: both system and user layer
-    sys_msg = {"role": "system", "content": PERSONA + " Keep answers under ~2 sentences."}
     user_msg = {"role": "user", "content": prompt + "\n\nReply briefly (≤2 sentences)."}
 
     # Try configured model
-    st, txt = await _pplx_request(key, configured, [sys_msg, user_msg], max_tokens, timeout_s)
-    import json
+    st, body = await _pplx_request(key, configured, [_SYS_MSG, user_msg], max_tokens, timeout_s)
     if st == 200:
         try:
-            data = json.loads(txt)
+            data = _json.loads(body)
             out = data["choices"][0]["message"]["content"].strip()
             return clamp_reply(out, int(settings.PIXEL_MAX_CHARS), int(settings.PIXEL_MAX_SENTENCES))
         except Exception:
             return "(Pixel error: unexpected response)"
 
     # Fallback model if invalid
-    low = txt.lower()
+    low = body.decode("utf-8", errors="replace").lower()
     if "invalid model" in low or st in (400, 404):
-        st2, txt2 = await _pplx_request(key, FALLBACK_MODEL, [sys_msg, user_msg], max_tokens, timeout_s)
+        st2, body2 = await _pplx_request(key, FALLBACK_MODEL, [_SYS_MSG, user_msg], max_tokens, timeout_s)
         if st2 == 200:
             try:
-                data2 = json.loads(txt2)
+                data2 = _json.loads(body2)
                 out2 = data2["choices"][0]["message"]["content"].strip()
                 return clamp_reply(out2, int(settings.PIXEL_MAX_CHARS), int(settings.PIXEL_MAX_SENTENCES))
             except Exception:
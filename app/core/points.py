@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.models import Points, Transaction, User
@@ -14,8 +15,12 @@ class PointsService:
         self.db = db
         self.settings = settings
 
-    def ensure_user(self, name: str) -> User:
-        """Ensure a User exists; if newly created, create points row and optionally grant starting points."""
+    def ensure_user(self, name: str, *, commit_now: bool = True) -> User:
+        """Ensure a User exists; if newly created, create points row and optionally grant starting points.
+
+        Pass commit_now=False when the caller owns the transaction boundary
+        (e.g. handle_chat commits once per message).
+        """
         name = (name or "").strip()
         if not name:
             raise ValueError("name is required")
@@ -51,7 +56,10 @@ class PointsService:
                     self.db.add(Transaction(user_id=user.id, type="grant", delta=start_amount, reason="start"))
 
         # Commit once after all operations are complete
-        self.db.commit()
+        if commit_now:
+            self.db.commit()
+        else:
+            self.db.flush()
 
         return user
 
@@ -59,32 +67,52 @@ class PointsService:
         pts = self.db.get(Points, user_id)
         return pts.balance if pts else 0
 
-    def grant(self, user_id: int, amount: int, reason: str) -> int:
+    def grant(self, user_id: int, amount: int, reason: str, *, commit_now: bool = True) -> int:
+        """Add points.
+
+        Pass commit_now=False when granting inside a larger unit of work (e.g.
+        bulk reward application) so the caller can commit once at the end.
+        """
         if amount == 0:
             return self.get_balance(user_id)
 
-        pts = self.db.get(Points, user_id)
-        if pts is None:
-            pts = Points(user_id=user_id, balance=0)
-            self.db.add(pts)
-
-        pts.balance += amount
+        # One atomic create-or-increment instead of get + conditional insert +
+        # update; also immune to lost updates under concurrent grants.
+        stmt = (
+            sqlite_insert(Points)
+            .values(user_id=user_id, balance=amount)
+            .on_conflict_do_update(
+                index_elements=["user_id"],
+                set_={"balance": Points.balance + amount},
+            )
+            .returning(Points.balance)
+        )
+        new_balance = int(self.db.execute(stmt).scalar_one())
         self.db.add(Transaction(user_id=user_id, type="grant", delta=amount, reason=reason))
-        self.db.commit()
-        return pts.balance
+        if commit_now:
+            self.db.commit()
+        return new_balance
 
-    def spend(self, user_id: int, amount: int, reason: str) -> int:
+    def spend(self, user_id: int, amount: int, reason: str, *, commit_now: bool = True) -> int:
         if amount <= 0:
             return self.get_balance(user_id)
 
-        pts = self.db.get(Points, user_id)
-        if pts is None or pts.balance < amount:
+        # Atomic conditional decrement: the WHERE clause rejects both a
+        # missing row and an insufficient balance in the same round trip.
+        stmt = (
+            update(Points)
+            .where(Points.user_id == user_id, Points.balance >= amount)
+            .values(balance=Points.balance - amount)
+            .returning(Points.balance)
+        )
+        new_balance = self.db.execute(stmt).scalar_one_or_none()
+        if new_balance is None:
             raise ValueError("Insufficient points")
 
-        pts.balance -= amount
         self.db.add(Transaction(user_id=user_id, type="spend", delta=-amount, reason=reason))
-        self.db.commit()
-        return pts.balance
+        if commit_now:
+            self.db.commit()
+        return int(new_balance)
 
     def adjust(
         self,
@@ -93,6 +121,7 @@ class PointsService:
         reason: str,
         *,
         allow_negative_balance: bool = False,
+        commit_now: bool = True,
     ) -> int:
         """Manual adjustment (admin).
 
@@ -112,15 +141,24 @@ class PointsService:
 
         pts.balance = new_balance
         self.db.add(Transaction(user_id=user_id, type="adjust", delta=int(delta), reason=reason))
-        self.db.commit()
+        if commit_now:
+            self.db.commit()
         return pts.balance
 
     def list_transactions(
         self,
         user_id: int | None = None,
         limit: int = 50,
+        before_id: int | None = None,
     ) -> list[Transaction]:
+        """List recent transactions, newest first.
+
+        Pass the last row's id as `before_id` to fetch the next page; keyset
+        pagination stays O(limit) where OFFSET would re-scan skipped rows.
+        """
         stmt = select(Transaction).order_by(Transaction.id.desc()).limit(max(1, int(limit)))
         if user_id is not None:
             stmt = stmt.where(Transaction.user_id == int(user_id))
+        if before_id is not None:
+            stmt = stmt.where(Transaction.id < int(before_id))
         return list(self.db.scalars(stmt))
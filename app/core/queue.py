@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import JSON, func, insert, literal, select
 from sqlalchemy.orm import Session
 from app.core.models import QueueItem
 
@@ -9,11 +9,51 @@ class QueueService:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def enqueue(self, kind: str, payload: dict) -> int:
-        item = QueueItem(kind=kind, payload_json=payload, status="pending")
-        self.db.add(item)
-        self.db.commit()
-        return item.id
+    def enqueue(
+        self,
+        kind: str,
+        payload: dict,
+        *,
+        max_pending: int | None = None,
+        commit_now: bool = True,
+    ) -> int | None:
+        """Enqueue a work item; returns the new id.
+
+        With `max_pending`, the insert only happens while fewer than that many
+        items of `kind` are pending — the cap is enforced inside the INSERT
+        itself, so two concurrent enqueues can't oversubscribe it. Returns
+        None when the queue is full.
+        """
+        if max_pending is None:
+            item = QueueItem(kind=kind, payload_json=payload, status="pending")
+            self.db.add(item)
+            if commit_now:
+                self.db.commit()
+            else:
+                self.db.flush()
+            return item.id
+
+        pending_count = (
+            select(func.count())
+            .select_from(QueueItem)
+            .where(QueueItem.kind == kind, QueueItem.status == "pending")
+            .scalar_subquery()
+        )
+        sel = select(
+            literal(kind),
+            literal(payload, type_=JSON),
+            literal("pending"),
+            func.now(),
+        ).where(pending_count < int(max_pending))
+        stmt = (
+            insert(QueueItem)
+            .from_select(["kind", "payload_json", "status", "created_at"], sel)
+            .returning(QueueItem.id)
+        )
+        qid = self.db.execute(stmt).scalar_one_or_none()
+        if qid is not None and commit_now:
+            self.db.commit()
+        return qid
 
     def list(self, status: str | None = None) -> list[QueueItem]:
         stmt = select(QueueItem).order_by(QueueItem.id.desc())
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from sqlalchemy import select
+from typing import Iterator
+from sqlalchemy import and_, bindparam, delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from app.core.models import Redeem
+from app.core.models import Cooldown, QueueItem, Redeem, User
 from app.core.points import PointsService
 from app.core.cooldowns import CooldownService
 from app.core.queue import QueueService
@@ -32,67 +34,125 @@ DEFAULT_REDEEMS: list[RedeemDefault] = [
 ]
 
 
+# Built once; every lookup reuses the same statement object so SQLAlchemy's
+# compilation cache hits instead of re-building the select per call.
+_GET_STMT = select(Redeem).where(Redeem.key == bindparam("key"))
+
+# One round trip for what redeem() needs from the DB up front: the user and
+# any cooldown for the (user, key) pair. Redeem metadata comes from the
+# in-process snapshot below.
+_CTX_STMT = (
+    select(User, Cooldown)
+    .select_from(User)
+    .outerjoin(Cooldown, and_(Cooldown.user_id == User.id, Cooldown.command == bindparam("key")))
+    .where(User.name == bindparam("user_name"))
+    .limit(1)
+)
+
+
+@dataclass(frozen=True)
+class RedeemSnapshot:
+    """Read-only view of the redeem fields the chat hot path needs."""
+
+    key: str
+    cost: int
+    enabled: bool
+    cooldown_s: int
+
+
+# Redeems are read on every command but written only via admin endpoints, and
+# the app runs as a single process — so a process-local snapshot invalidated
+# by toggle/upsert/seed is enough to drop the per-redeem SELECT.
+_SNAPSHOT: dict[str, RedeemSnapshot] | None = None
+
+
+def _invalidate_snapshot() -> None:
+    global _SNAPSHOT
+    _SNAPSHOT = None
+
+
 class RedeemsService:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, *, commit_now: bool = True) -> None:
+        """With commit_now=False the service only mutates the session; the
+        caller commits once at its own boundary (handle_chat does this per
+        message). Admin endpoints keep the default self-committing behavior.
+        """
         self.db = db
+        self.commit_now = commit_now
         self.points = PointsService(db)
         self.cooldowns = CooldownService(db)
         self.queue = QueueService(db)
 
+    def _commit(self) -> None:
+        if self.commit_now:
+            self.db.commit()
+
     def seed_defaults(self, settings: Settings | None = None) -> None:
         """Ensure the default redeems exist.
 
         If settings is provided, we use it to set more accurate initial cooldowns for tts/pixel
         while still allowing admin to override later.
         """
-        defaults = DEFAULT_REDEEMS
-
+        # Only the tts cooldown is settings-driven (pixel stays ~20s); fetch
+        # it once instead of hitting the pydantic settings model per default.
+        # These only apply when creating missing records (does NOT overwrite admin values).
+        tts_cd = None
         if settings is not None:
-            # Match prior behavior where !tts cooldown came from settings, and pixel was ~20s.
-            # These only apply when creating missing records (does NOT overwrite admin values).
-            patched: list[RedeemDefault] = []
-            for d in defaults:
-                if d.key == "tts":
-                    patched.append(
-                        RedeemDefault(
-                            d.key,
-                            d.display_name,
-                            d.cost,
-                            d.enabled,
-                            max(1, int(getattr(settings, "TTS_COOLDOWN_SECONDS", d.cooldown_s) or d.cooldown_s)),
-                        )
-                    )
-                else:
-                    patched.append(d)
-            defaults = patched
-
-        for d in defaults:
-            r = self.get(d.key)
-            if r is None:
-                self.db.add(
-                    Redeem(
-                        key=d.key,
-                        display_name=d.display_name,
-                        cost=int(d.cost),
-                        enabled=bool(d.enabled),
-                        cooldown_s=int(d.cooldown_s),
-                    )
-                )
-        self.db.commit()
+            tts_cd = max(1, int(getattr(settings, "TTS_COOLDOWN_SECONDS", 10) or 10))
+
+        # One idempotent batch insert; existing rows (including admin-edited
+        # values) are left untouched by DO NOTHING.
+        rows = [
+            {
+                "key": d.key,
+                "display_name": d.display_name,
+                "cost": int(d.cost),
+                "enabled": bool(d.enabled),
+                "cooldown_s": tts_cd if (d.key == "tts" and tts_cd is not None) else int(d.cooldown_s),
+            }
+            for d in DEFAULT_REDEEMS
+        ]
+        self.db.execute(
+            sqlite_insert(Redeem).values(rows).on_conflict_do_nothing(index_elements=["key"])
+        )
+        self._commit()
+        _invalidate_snapshot()
 
     def get(self, key: str) -> Redeem | None:
-        return self.db.scalar(select(Redeem).where(Redeem.key == key))
+        return self.db.scalar(_GET_STMT, {"key": key})
+
+    def get_snapshot(self, key: str) -> RedeemSnapshot | None:
+        global _SNAPSHOT
+        snap = _SNAPSHOT
+        if snap is None:
+            snap = {
+                r.key: RedeemSnapshot(r.key, int(r.cost), bool(r.enabled), int(r.cooldown_s or 0))
+                for r in self.db.scalars(select(Redeem))
+            }
+            _SNAPSHOT = snap
+        return snap.get(key)
+
+    def iter_all(self) -> Iterator[Redeem]:
+        """Stream redeems in key order without materializing them all.
+
+        Prefer this from paginated/streaming admin views; rows hydrate in
+        batches of 100 as they are consumed.
+        """
+        yield from self.db.scalars(
+            select(Redeem).order_by(Redeem.key.asc()).execution_options(yield_per=100)
+        )
 
     def list(self) -> list[Redeem]:
-        return list(self.db.scalars(select(Redeem).order_by(Redeem.key.asc())))
+        return list(self.iter_all())
 
     def toggle(self, key: str, enabled: bool) -> None:
         r = self.get(key)
         if r is None:
             raise ValueError("Redeem not found")
+        # updated_at is refreshed by the column-level onupdate
         r.enabled = bool(enabled)
-        r.updated_at = datetime.utcnow()
-        self.db.commit()
+        self._commit()
+        _invalidate_snapshot()
 
     def upsert(self, key: str, display_name: str, cost: int, enabled: bool, cooldown_s: int = 0) -> Redeem:
         r = self.get(key)
@@ -110,8 +170,8 @@ class RedeemsService:
             r.cost = int(cost)
             r.enabled = bool(enabled)
             r.cooldown_s = int(cooldown_s or 0)
-            r.updated_at = datetime.utcnow()
-        self.db.commit()
+        self._commit()
+        _invalidate_snapshot()
         return r
 
     # --- Core redeem flow (accounting + optional queue) ---
@@ -123,6 +183,7 @@ class RedeemsService:
         *,
         queue_kind: str | None = None,
         payload: dict | None = None,
+        max_pending: int | None = None,
     ) -> dict:
         """Attempt to redeem `key` for `user_name`.
 
@@ -135,33 +196,79 @@ class RedeemsService:
         cooldown_s:
           - If provided: overrides DB cooldown for this call (keeps old behavior possible)
           - If None: uses the DB field Redeem.cooldown_s
+
+        max_pending:
+          - With queue_kind, cap the pending queue for that kind; enforced
+            atomically inside the enqueue so concurrent redeems can't
+            oversubscribe it. The item is enqueued (uncommitted) before the
+            spend, so a full queue costs the user nothing.
         """
-        user = self.points.ensure_user(user_name)
-        r = self.get(key)
+        # Redeem metadata from the process-local snapshot — no SELECT on hit
+        r = self.get_snapshot(key)
         if not r or not r.enabled:
             return {"ok": False, "error": "Redeem disabled or missing"}
 
+        # Fast path: user + cooldown in one SELECT. Falls back to ensure_user
+        # (which creates the user/points rows) when the user is new.
+        row = self.db.execute(_CTX_STMT, {"key": key, "user_name": (user_name or "").strip()}).first()
+        if row is not None:
+            user, cd = row
+            # parity with ensure_user; persisted with the spend commit
+            user.last_seen = datetime.utcnow()
+        else:
+            user = self.points.ensure_user(user_name, commit_now=self.commit_now)
+            cd = None
+
         effective_cd = int(r.cooldown_s or 0) if cooldown_s is None else int(cooldown_s)
 
-        # cooldown check
-        if effective_cd > 0:
-            active, remaining = self.cooldowns.is_active(user.id, key)
-            if active:
+        # cooldown check (row already fetched above)
+        if effective_cd > 0 and cd is not None:
+            now = datetime.utcnow()
+            if cd.expires_at > now:
+                remaining = (cd.expires_at - now).total_seconds()
                 return {"ok": False, "error": f"Cooldown active: {int(remaining)}s left"}
+            # expired; removed with the next commit
+            self.db.delete(cd)
+
+        # capped enqueue first (uncommitted): a full queue bails out before
+        # any points move — a rejected insert writes nothing, so there is
+        # nothing to roll back
+        qid = None
+        if queue_kind and max_pending is not None:
+            qid = self.queue.enqueue(
+                queue_kind,
+                payload or {"user": user.name, "redeem": key},
+                max_pending=max_pending,
+                commit_now=False,
+            )
+            if qid is None:
+                return {"ok": False, "error": "Queue is full, try again shortly."}
 
         # spend points
         try:
-            self.points.spend(user.id, int(r.cost), reason=f"redeem:{key}")
+            self.points.spend(user.id, int(r.cost), reason=f"redeem:{key}", commit_now=self.commit_now)
         except ValueError:
+            if qid is not None:
+                # drop the pre-enqueued (still uncommitted) item; keep the
+                # ensure_user work
+                self.db.execute(delete(QueueItem).where(QueueItem.id == qid))
+                qid = None
             return {"ok": False, "error": "Insufficient points"}
 
         # set cooldown
         if effective_cd > 0:
-            self.cooldowns.set(user.id, key, effective_cd)
+            self.cooldowns.set(user.id, key, effective_cd, commit_now=self.commit_now)
 
-        # enqueue action
-        qid = None
-        if queue_kind:
-            qid = self.queue.enqueue(queue_kind, payload or {"user": user.name, "redeem": key})
+        # enqueue action (uncapped path)
+        if queue_kind and max_pending is None:
+            qid = self.queue.enqueue(
+                queue_kind,
+                payload or {"user": user.name, "redeem": key},
+                commit_now=self.commit_now,
+            )
+        elif qid is not None:
+            # capped item was inserted uncommitted; close out the message's
+            # unit of work unless the caller owns the boundary
+            self._commit()
 
         return {"ok": True, "user": user.name, "redeem": key, "queue_id": qid}
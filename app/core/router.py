@@ -1,13 +1,15 @@
 from __future__ import annotations
-from typing import Sequence
-from pathlib import Path
+import bisect
+import itertools
+import re
+from dataclasses import dataclass
+from typing import Callable, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import select
 from app.core.points import PointsService
 from app.core.redeems import RedeemsService
-from app.core.sfx import validate_sound_file
+from app.core.sfx import list_sound_files, validate_sound_file
 from app.core.config import Settings
-from app.core.models import QueueItem
+from app.core.models import QueueItem, User
 from app.core.xp import XpService
 
 
@@ -18,30 +20,47 @@ HELP_TEXT = (
 # Sounds per page for !listsounds command
 SOUNDS_PER_PAGE = 15
 
+# Default redeem rows change almost never; verify/create them once per
+# process instead of re-checking on every chat line.
+_DEFAULTS_SEEDED = False
+
+# Fixed replies, shared across calls instead of re-allocated per message.
+# _OK_EMPTY is returned as-is; callers only read it.
+_OK_EMPTY: dict = {"ok": True}
+_USAGE_TTS = "Usage: !tts <message>"
+_USAGE_PIXEL = "Usage: !pixel <message>"
+_USAGE_SOUND = "Usage: !sound <name>"
+_USAGE_LISTSOUNDS = "Usage: !listsounds [page_number]"
+_MSG_TTS_SENT = "TTS sent!"
+_MSG_PIXEL_THINKING = "Pixel is thinking…"
+_MSG_SPINNING = "Spinning the wheel…"
+_MSG_CLIP = "Clip requested."
+_MSG_BUZZ = "Sending a buzzie..."
+_MSG_UNKNOWN = "Unknown command. Try !help"
+
+
+# One pass in C: no stripped copy of the message, no filter comprehension
+_WORD_RE = re.compile(r"\S+")
+
 
 def parse_words(text: str) -> list[str]:
-    return [w for w in text.strip().split() if w]
+    return _WORD_RE.findall(text)
 
 
 def is_command(text: str) -> bool:
-    return text.strip().startswith("!")
+    return bool(text) and text.lstrip()[:1] == "!"
 
 
 def get_available_sounds(settings: Settings) -> list[str]:
-    """Get list of all available sound files from the sounds directory."""
-    sounds_path = Path(settings.SOUNDS_DIR).resolve()
-    if not sounds_path.exists() or not sounds_path.is_dir():
+    """Get list of all available sound files from the sounds directory.
+
+    Thin wrapper over sfx.list_sound_files (the one authoritative, cached
+    directory listing) so the router and admin can't drift apart.
+    """
+    try:
+        return list_sound_files(settings)
+    except OSError:
         return []
-    
-    # Get all audio files (common formats)
-    extensions = {'.wav', '.mp3', '.ogg', '.flac', '.m4a'}
-    sounds = []
-    
-    for file in sounds_path.iterdir():
-        if file.is_file() and file.suffix.lower() in extensions:
-            sounds.append(file.name)
-    
-    return sorted(sounds)
 
 
 def format_sounds_list(sounds: list[str], page: int = 1, per_page: int = SOUNDS_PER_PAGE) -> str:
@@ -68,142 +87,210 @@ def format_sounds_list(sounds: list[str], page: int = 1, per_page: int = SOUNDS_
     # Format output
     sounds_str = ", ".join(page_sounds)
     footer = f" | Page {page}/{total_pages} ({total} total)"
-    
-    # If message would be too long for chat, truncate the list
+
+    # If message would be too long for chat, truncate the list. Bisect the
+    # cumulative lengths for the largest prefix that fits — one pass and one
+    # join, instead of re-joining after every pop.
     MAX_CHAT_LEN = 400
     if len(sounds_str) + len(footer) > MAX_CHAT_LEN:
-        # Reduce list until it fits
-        while page_sounds and len(", ".join(page_sounds)) + len(footer) > MAX_CHAT_LEN:
-            page_sounds.pop()
-        sounds_str = ", ".join(page_sounds)
-        if len(page_sounds) < (end_idx - start_idx):
+        # cum[i] counts names 0..i plus a ", " per name; a k-name join is
+        # cum[k-1] - 2, so the fit condition is cum[k-1] <= budget + 2
+        cum = list(itertools.accumulate(len(name) + 2 for name in page_sounds))
+        k = bisect.bisect_right(cum, (MAX_CHAT_LEN - len(footer)) + 2)
+        sounds_str = ", ".join(page_sounds[:k])
+        if k < len(page_sounds):
             sounds_str += "..."
-    
+
     return f"Sounds: {sounds_str}{footer}"
 
 
-def handle_chat(db: Session, settings: Settings, user: str, text: str) -> dict:
-    ps = PointsService(db)
-    rs = RedeemsService(db)
-    rs.seed_defaults(settings)
-
-    user = ps.ensure_user(user).name
-    words = parse_words(text)
-    if not words:
-        return {"ok": True}
-
-    cmd = words[0].lower()
-    args = words[1:]
-
-    if cmd == "!help":
-        return {"ok": True, "say": HELP_TEXT}
-
-    if cmd == "!xp":
-        xs = XpService(db, settings)
-        return {"ok": True, "say": xs.get_progress_text(user)}
-
-    if cmd == "!level":
-        xs = XpService(db, settings)
-        u, xp = xs.ensure_user_xp(user)
-        return {"ok": True, "say": f"@{u.name} — Level {xp.level} (XP {xp.total_xp})"}
-
-    if cmd == "!tts":
-        if not args:
-            return {"ok": False, "say": "Usage: !tts <message>"}
-        # FIX: Count both 'pending' AND 'running' items to prevent stuck items from blocking queue
-        active_tts = len(list(db.scalars(
-            select(QueueItem).where(
-                QueueItem.kind == 'tts',
-                QueueItem.status.in_(['pending'])
-            )
-        )))
-        if active_tts >= max(1, settings.TTS_QUEUE_MAX):
-            return {"ok": False, "say": "TTS queue is full, try again shortly."}
-        payload = {
-            "user": user,
-            "message": " ".join(args),
-            "prefix": bool(settings.TTS_PREFIX_USERNAME),
-        }
-        result = rs.redeem(user, "tts", cooldown_s=None, queue_kind="tts", payload=payload)
-        if not result.get("ok"):
-            return {"ok": False, "say": result.get("error", "TTS failed")}
-        return {"ok": True, "say": "TTS sent!"}
-
-    if cmd == "!pixel":
-        if not args:
-            return {"ok": False, "say": "Usage: !pixel <message>"}
-        payload = {"user": user, "message": " ".join(args)}
-        # Cooldown is controlled in admin via redeem.cooldown_s
-        result = rs.redeem(user, "pixel", cooldown_s=None, queue_kind="pixel", payload=payload)
-        if not result.get("ok"):
-            return {"ok": False, "say": result.get("error", "Pixel failed")}
-        return {"ok": True, "say": "Pixel is thinking…"}
-
-    if cmd == "!sound":
-        if not args:
-            return {"ok": False, "say": "Usage: !sound <name>"}
-        try:
-            actual = validate_sound_file(settings, args[0])
-        except Exception:
-            return {"ok": False, "say": f"Sound not found: {args[0]}"}
-        payload = {"user": user, "sound": actual}
-        result = rs.redeem(user, "sound", cooldown_s=None, queue_kind="sound", payload=payload)
-        if not result.get("ok"):
-            return {"ok": False, "say": result.get("error", "Sound failed")}
-        return {"ok": True, "say": f"Queued sound: {actual}"}
-
-    if cmd == "!spin":
-        payload = {"user": user}
-        result = rs.redeem(user, "spin", cooldown_s=None, queue_kind="spin", payload=payload)
-        if not result.get("ok"):
-            return {"ok": False, "say": result.get("error", "Spin failed")}
-        return {"ok": True, "say": "Spinning the wheel…"}
-
-    if cmd == "!listsounds":
-        # Parse page number from args
-        page = 1
-        if args:
-            try:
-                page = int(args[0])
-            except ValueError:
-                return {"ok": False, "say": "Usage: !listsounds [page_number]"}
-        
-        # Get available sounds and format response
-        sounds = get_available_sounds(settings)
-        message = format_sounds_list(sounds, page=page, per_page=SOUNDS_PER_PAGE)
-        
-        return {"ok": True, "say": message}
-
-    if cmd == "!points" or cmd == "!balance":
-        ps = PointsService(db)
-        u = ps.ensure_user(user)
-        balance = ps.get_balance(u.id)
-        # Return whisper=True so the handler knows to whisper
-        return {"ok": True, "say": f"@{u.name} has {balance} points.", "whisper": True}
-
-    if cmd == "!clip":
-        payload = {"user": user}
-        result = rs.redeem(user, "clip", cooldown_s=None, queue_kind="clip", payload=payload)
-        if not result.get("ok"):
-            return {"ok": False, "say": result.get("error", "Clip failed")}
-        return {"ok": True, "say": "Clip requested."}
-        
-    if cmd == "!buzz":
-        # Queue the extension trigger
-        payload = {"user": user, "action": "click_tip"}
-        result = rs.redeem(user, "remotetip", cooldown_s=None, queue_kind="extension", payload=payload)
-        if not result.get("ok"):
-            return {"ok": False, "say": result.get("error", "Buzzie failed!")}
-        
-        # Also queue the buzz sound
+@dataclass
+class Ctx:
+    """Per-message context handed to command handlers."""
+
+    db: Session
+    settings: Settings
+    ps: PointsService
+    rs: RedeemsService
+    user: str
+    user_row: User
+
+
+def _cmd_help(ctx: Ctx, args: list[str]) -> dict:
+    return {"ok": True, "say": HELP_TEXT}
+
+
+def _cmd_xp(ctx: Ctx, args: list[str]) -> dict:
+    xs = XpService(ctx.db, ctx.settings)
+    return {"ok": True, "say": xs.get_progress_text(ctx.user, user=ctx.user_row)}
+
+
+def _cmd_level(ctx: Ctx, args: list[str]) -> dict:
+    xs = XpService(ctx.db, ctx.settings)
+    u, xp = xs.ensure_user_xp(ctx.user, user=ctx.user_row)
+    return {"ok": True, "say": f"@{u.name} — Level {xp.level} (XP {xp.total_xp})"}
+
+
+def _cmd_tts(ctx: Ctx, args: list[str]) -> dict:
+    if not args:
+        return {"ok": False, "say": _USAGE_TTS}
+    payload = {
+        "user": ctx.user,
+        "message": " ".join(args),
+        "prefix": bool(ctx.settings.TTS_PREFIX_USERNAME),
+    }
+    # The queue cap is enforced atomically inside the enqueue, so a burst
+    # of concurrent !tts can't oversubscribe it.
+    result = ctx.rs.redeem(
+        ctx.user, "tts", cooldown_s=None, queue_kind="tts", payload=payload,
+        max_pending=max(1, ctx.settings.TTS_QUEUE_MAX),
+    )
+    if not result.get("ok"):
+        return {"ok": False, "say": result.get("error", "TTS failed")}
+    return {"ok": True, "say": _MSG_TTS_SENT}
+
+
+def _cmd_pixel(ctx: Ctx, args: list[str]) -> dict:
+    if not args:
+        return {"ok": False, "say": _USAGE_PIXEL}
+    payload = {"user": ctx.user, "message": " ".join(args)}
+    # Cooldown is controlled in admin via redeem.cooldown_s
+    result = ctx.rs.redeem(ctx.user, "pixel", cooldown_s=None, queue_kind="pixel", payload=payload)
+    if not result.get("ok"):
+        return {"ok": False, "say": result.get("error", "Pixel failed")}
+    return {"ok": True, "say": _MSG_PIXEL_THINKING}
+
+
+def _cmd_sound(ctx: Ctx, args: list[str]) -> dict:
+    if not args:
+        return {"ok": False, "say": _USAGE_SOUND}
+    try:
+        actual = validate_sound_file(ctx.settings, args[0])
+    except Exception:
+        return {"ok": False, "say": f"Sound not found: {args[0]}"}
+    payload = {"user": ctx.user, "sound": actual}
+    result = ctx.rs.redeem(ctx.user, "sound", cooldown_s=None, queue_kind="sound", payload=payload)
+    if not result.get("ok"):
+        return {"ok": False, "say": result.get("error", "Sound failed")}
+    return {"ok": True, "say": f"Queued sound: {actual}"}
+
+
+def _cmd_spin(ctx: Ctx, args: list[str]) -> dict:
+    payload = {"user": ctx.user}
+    result = ctx.rs.redeem(ctx.user, "spin", cooldown_s=None, queue_kind="spin", payload=payload)
+    if not result.get("ok"):
+        return {"ok": False, "say": result.get("error", "Spin failed")}
+    return {"ok": True, "say": _MSG_SPINNING}
+
+
+def _cmd_listsounds(ctx: Ctx, args: list[str]) -> dict:
+    # Parse page number from args
+    page = 1
+    if args:
         try:
-            actual = validate_sound_file(settings, "buzz.wav")
-            sound_payload = {"user": user, "sound": actual}
-            db.add(QueueItem(kind='sound', status='pending', payload_json=sound_payload))
-            db.commit()
-        except Exception:
-            pass  # Sound is optional, don't fail the command if buzz.wav is missing
-        
-        return {"ok": True, "say": "Sending a buzzie..."}
-        
-    return {"ok": False, "say": "Unknown command. Try !help"}
+            page = int(args[0])
+        except ValueError:
+            return {"ok": False, "say": _USAGE_LISTSOUNDS}
+
+    # Get available sounds and format response
+    sounds = get_available_sounds(ctx.settings)
+    message = format_sounds_list(sounds, page=page, per_page=SOUNDS_PER_PAGE)
+
+    return {"ok": True, "say": message}
+
+
+def _cmd_points(ctx: Ctx, args: list[str]) -> dict:
+    # ensure_user already ran in handle_chat; reuse its row
+    balance = ctx.ps.get_balance(ctx.user_row.id)
+    # Return whisper=True so the handler knows to whisper
+    return {"ok": True, "say": f"@{ctx.user_row.name} has {balance} points.", "whisper": True}
+
+
+def _cmd_clip(ctx: Ctx, args: list[str]) -> dict:
+    payload = {"user": ctx.user}
+    result = ctx.rs.redeem(ctx.user, "clip", cooldown_s=None, queue_kind="clip", payload=payload)
+    if not result.get("ok"):
+        return {"ok": False, "say": result.get("error", "Clip failed")}
+    return {"ok": True, "say": _MSG_CLIP}
+
+
+def _cmd_buzz(ctx: Ctx, args: list[str]) -> dict:
+    # Queue the extension trigger
+    payload = {"user": ctx.user, "action": "click_tip"}
+    result = ctx.rs.redeem(ctx.user, "remotetip", cooldown_s=None, queue_kind="extension", payload=payload)
+    if not result.get("ok"):
+        return {"ok": False, "say": result.get("error", "Buzzie failed!")}
+
+    # Also queue the buzz sound
+    try:
+        actual = validate_sound_file(ctx.settings, "buzz.wav")
+        sound_payload = {"user": ctx.user, "sound": actual}
+        # committed with the message's single commit in handle_chat
+        ctx.db.add(QueueItem(kind='sound', status='pending', payload_json=sound_payload))
+    except Exception:
+        pass  # Sound is optional, don't fail the command if buzz.wav is missing
+
+    return {"ok": True, "say": _MSG_BUZZ}
+
+
+# Command dispatch: one dict lookup instead of a chain of string compares.
+COMMANDS: dict[str, Callable[[Ctx, list[str]], dict]] = {
+    "!help": _cmd_help,
+    "!xp": _cmd_xp,
+    "!level": _cmd_level,
+    "!tts": _cmd_tts,
+    "!pixel": _cmd_pixel,
+    "!sound": _cmd_sound,
+    "!spin": _cmd_spin,
+    "!listsounds": _cmd_listsounds,
+    "!points": _cmd_points,
+    "!balance": _cmd_points,
+    "!clip": _cmd_clip,
+    "!buzz": _cmd_buzz,
+}
+
+
+def handle_chat(db: Session, settings: Settings, user: str, text: str) -> dict:
+    global _DEFAULTS_SEEDED
+
+    # Ordinary chat lines (the vast majority of traffic) never need services
+    # or the DB here — passive XP/points run on their own path.
+    if not is_command(text):
+        return _OK_EMPTY
+
+    # Memoize service instances on the session so repeated dispatches within
+    # one request don't rebuild them. Services run in deferred-commit mode:
+    # handle_chat owns the transaction and commits once per message below.
+    info = db.info
+    ps: PointsService | None = info.get("points_service")
+    if ps is None:
+        ps = info["points_service"] = PointsService(db)
+    rs: RedeemsService | None = info.get("redeems_service")
+    if rs is None:
+        rs = info["redeems_service"] = RedeemsService(db, commit_now=False)
+    if not _DEFAULTS_SEEDED:
+        rs.seed_defaults(settings)
+        # Commit the seed rows before marking them done: if the flag flipped
+        # on uncommitted work and the message later rolled back, the defaults
+        # would be gone for the rest of the process.
+        db.commit()
+        _DEFAULTS_SEEDED = True
+
+    try:
+        user_row = ps.ensure_user(user, commit_now=False)
+        user = user_row.name
+        words = parse_words(text)
+        if not words:
+            result = _OK_EMPTY
+        else:
+            handler = COMMANDS.get(words[0].lower())
+            if handler is None:
+                result = {"ok": False, "say": _MSG_UNKNOWN}
+            else:
+                result = handler(Ctx(db, settings, ps, rs, user, user_row), words[1:])
+        # single fsync per message instead of one per service write
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result
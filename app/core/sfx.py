@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
+import time
 from pathlib import Path
 from typing import List, Optional
 
@@ -15,20 +19,52 @@ ALLOWED_EXTS = {".wav", ".mp3", ".ogg", ".m4a", ".aac", ".flac"}
 
 def _sounds_dir(settings: Settings) -> Path:
     # Expect settings.SOUNDS_DIR to be configured already
-    p = Path(getattr(settings, "SOUNDS_DIR", "./sounds")).resolve()
+    return _sounds_dir_cached(getattr(settings, "SOUNDS_DIR", "./sounds"))
+
+
+@functools.lru_cache(maxsize=4)
+def _sounds_dir_cached(path_str: str) -> Path:
+    # resolve() and mkdir both hit the filesystem; the configured dir doesn't
+    # change at runtime, so do it once per configured path.
+    p = Path(path_str).resolve()
     p.mkdir(parents=True, exist_ok=True)
     return p
 
+# Listing cache: path -> (expires_at, dir mtime_ns, files). The sounds dir
+# changes rarely but overlays/admin poll the listing; a short TTL plus an
+# mtime check turns the per-request walk into a dict hit.
+_LIST_TTL_S = 5.0
+_LIST_CACHE: dict[str, tuple[float, int, List[str]]] = {}
+
+
 def list_sound_files(settings: Settings) -> List[str]:
     """
     Return a sorted list of file names (not full paths) in SOUNDS_DIR that match ALLOWED_EXTS.
+
+    Results are cached for a few seconds (invalidated eagerly when the
+    directory mtime changes).
     """
     base = _sounds_dir(settings)
+    key = str(base)
+    now = time.monotonic()
+    mtime = os.stat(base).st_mtime_ns
+
+    cached = _LIST_CACHE.get(key)
+    if cached is not None and now < cached[0] and cached[1] == mtime:
+        return cached[2]
+
+    # scandir: is_file() answers from the dirent data, so the rescan is one
+    # getdents pass instead of a stat per entry; extensions are matched on
+    # the raw names without building Path objects.
     files: List[str] = []
-    for f in base.iterdir():
-        if f.is_file() and f.suffix.lower() in ALLOWED_EXTS:
-            files.append(f.name)
+    with os.scandir(base) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                ext = entry.name.rpartition(".")[2].lower()
+                if f".{ext}" in ALLOWED_EXTS:
+                    files.append(entry.name)
     files.sort(key=str.lower)
+    _LIST_CACHE[key] = (now + _LIST_TTL_S, mtime, files)
     return files
 
 def validate_sound_file(settings: Settings, name: str) -> str:
@@ -37,63 +73,100 @@ def validate_sound_file(settings: Settings, name: str) -> str:
 
     Returns the *actual filename* (with extension) if found/valid.
     Raises ValueError if not found or extension not allowed.
+
+    Lookups hit a name→filename index built once per directory state, so
+    the common case is one stat plus a dict get instead of probing every
+    allowed extension on disk.
     """
     base = _sounds_dir(settings)
     raw = (name or "").strip()
     if not raw:
         raise ValueError("Empty sound name")
 
+    idx = _sound_index(str(base), base.stat().st_mtime_ns)
+    hit = idx.get(raw.lower()) or idx.get(Path(raw).stem.lower())
+    if hit:
+        return hit
+
+    # Distinguish "exists but not an audio file" from a plain miss
     candidate = base / raw
-    if candidate.exists() and candidate.is_file():
-        if candidate.suffix.lower() not in ALLOWED_EXTS:
-            raise ValueError(f"Unsupported extension: {candidate.suffix}")
-        return candidate.name
-
-    # If extension was omitted, match any allowed ext by stem
-    stem = Path(raw).stem
-    for ext in ALLOWED_EXTS:
-        c = base / f"{stem}{ext}"
-        if c.exists() and c.is_file():
-            return c.name
+    if candidate.is_file() and candidate.suffix.lower() not in ALLOWED_EXTS:
+        raise ValueError(f"Unsupported extension: {candidate.suffix}")
 
     raise ValueError(f"Sound not found: {raw}")
 
+
+@functools.lru_cache(maxsize=8)
+def _sound_index(base_str: str, mtime_ns: int) -> dict[str, str]:
+    """Map lowercased filename and bare stem to the real filename.
+
+    Entries are inserted in name order so a stem shared by several files
+    resolves deterministically (first name wins).
+    """
+    index: dict[str, str] = {}
+    with os.scandir(base_str) as it:
+        for entry in sorted(it, key=lambda e: e.name.lower()):
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            stem, _, ext = entry.name.rpartition(".")
+            if f".{ext.lower()}" not in ALLOWED_EXTS:
+                continue
+            index.setdefault(entry.name.lower(), entry.name)
+            if stem:
+                index.setdefault(stem.lower(), entry.name)
+    return index
+
 # ----------------------------
 # Overlay broadcast (SFX overlay protocol)
 # ----------------------------
 
+# URL-ish prefixes; startswith with a tuple short-circuits in one C call
+_URL_PREFIXES = ("http://", "https://", "/")
+
+
 def _name_or_url(name_or_url: str) -> dict:
     s = (name_or_url or "").strip()
     # If it looks like a URL or absolute path, send as url; else send as name
-    if s.startswith("http://") or s.startswith("https://") or s.startswith("/"):
-        return {"url": s}
-    return {"name": s}
+    return {"url": s} if s.startswith(_URL_PREFIXES) else {"name": s}
+
+
+def _log_broadcast_error(task: "asyncio.Task") -> None:
+    if not task.cancelled() and task.exception() is not None:
+        print(f"[sfx] broadcast failed: {task.exception()}")
+
+
+def _schedule_broadcast(bus: OverlayBus, message: dict) -> None:
+    # Fire-and-forget: the overlay can't exert useful backpressure, so don't
+    # make TTS/wheel flows wait for every client socket to drain.
+    task = asyncio.get_running_loop().create_task(bus.broadcast(message))
+    task.add_done_callback(_log_broadcast_error)
+
 
-async def play_sfx(bus: OverlayBus, name_or_url: str) -> None:
+def play_sfx(bus: OverlayBus, name_or_url: str) -> None:
     """
-    One-shot playback. SFX overlay expects:
+    One-shot playback (scheduled, not awaited). SFX overlay expects:
       { type: 'sfx', action: 'play', url?: string, name?: string }
     """
-    await bus.broadcast({
+    _schedule_broadcast(bus, {
         "type": "sfx",
         "action": "play",
         **_name_or_url(name_or_url),
     })
 
-async def loop_start(bus: OverlayBus, name_or_url: str) -> None:
+def loop_start(bus: OverlayBus, name_or_url: str) -> None:
     """
-    Start looping playback. SFX overlay expects:
+    Start looping playback (scheduled, not awaited). SFX overlay expects:
       { type: 'sfx', action: 'loop-start', url?: string, name?: string }
     """
-    await bus.broadcast({
+    _schedule_broadcast(bus, {
         "type": "sfx",
         "action": "loop-start",
         **_name_or_url(name_or_url),
     })
 
-async def loop_stop(bus: OverlayBus) -> None:
-    """Stop looping playback. SFX overlay expects { type:'sfx', action:'loop-stop' }."""
-    await bus.broadcast({
+def loop_stop(bus: OverlayBus) -> None:
+    """Stop looping playback (scheduled). SFX overlay expects { type:'sfx', action:'loop-stop' }."""
+    _schedule_broadcast(bus, {
         "type": "sfx",
         "action": "loop-stop",
     })
@@ -1,5 +1,4 @@
 from pathlib import Path
-import asyncio
 from .bus import SignalBus
 from .obs import OBSHandler
 from .vrchat import VRChatOSCHandler
@@ -23,5 +22,7 @@ def init_signal_bus(settings) -> SignalBus:
     bus.register(obs)
     bus.register(vrc)
 
-    asyncio.create_task(obs.connect())
+    # Bus-owned task: a free-floating create_task can be GC'd mid-flight and
+    # swallows connection errors.
+    bus.track(obs.connect(), name="obs.connect")
     return bus
@@ -1,14 +1,65 @@
 import asyncio
+import logging
 from typing import List
 from .base import Signal, BaseSignalHandler
 
+log = logging.getLogger("pixel.signals")
+
+
+async def _run_handlers(coros, name: str) -> None:
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for r in results:
+        if isinstance(r, Exception):
+            log.error(f"[signals] handler failed for {name}: {r}")
+
+
 class SignalBus:
     def __init__(self):
         self._handlers: List[BaseSignalHandler] = []
+        # Long-lived tasks (e.g. obs.connect at startup). Holding a reference
+        # keeps asyncio from garbage-collecting them mid-flight, and aclose()
+        # gives shutdown something to cancel.
+        self._tasks: set[asyncio.Task] = set()
 
     def register(self, handler: BaseSignalHandler) -> None:
         self._handlers.append(handler)
 
+    def track(self, coro, *, name: str) -> asyncio.Task:
+        """Create a task owned by the bus; failures are logged, not lost."""
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"[signals] task {task.get_name()} failed: {task.exception()}")
+
+    async def aclose(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
     def emit(self, signal: Signal) -> None:
-        for handler in self._handlers:
-            asyncio.create_task(handler.handle(signal))
+        # One task per signal, not per handler: the handler coroutines run
+        # gathered under a single (named, profiler-friendly) task instead of
+        # paying event-loop scheduling for each registered handler.
+        handlers = self._handlers
+        if not handlers:
+            return
+        if len(handlers) == 1:
+            task = asyncio.create_task(handlers[0].handle(signal), name=f"signal:{signal.name}")
+            task.add_done_callback(_log_task_error)
+        else:
+            asyncio.create_task(
+                _run_handlers([h.handle(signal) for h in handlers], signal.name),
+                name=f"signal:{signal.name}",
+            )
+
+
+def _log_task_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        log.error(f"[signals] handler failed: {task.exception()}")
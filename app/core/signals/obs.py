@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from obsws_python import ReqClient
 from .base import Signal, BaseSignalHandler
@@ -14,14 +15,18 @@ class OBSHandler(BaseSignalHandler):
 
     async def connect(self):
         try:
-            # obsws-python v1.7.0+ uses ReqClient instead of obsws
-            self._client = ReqClient(host=self._host, port=self._port, password=self._password)
+            # obsws-python v1.7.0+ uses ReqClient instead of obsws.
+            # ReqClient calls are blocking websocket round-trips; run them in
+            # a thread so they don't stall the event loop.
+            self._client = await asyncio.to_thread(
+                ReqClient, host=self._host, port=self._port, password=self._password
+            )
             self._connected = True
             log.info("[OBS] Connected")
             
             # Check replay buffer status
             try:
-                status = self._client.get_replay_buffer_status()
+                status = await asyncio.to_thread(self._client.get_replay_buffer_status)
                 if hasattr(status, 'output_active'):
                     if not status.output_active:
                         log.warning("[OBS] Replay buffer is NOT active")
@@ -41,7 +46,7 @@ class OBSHandler(BaseSignalHandler):
             return
         if signal.name == "clip.requested":
             try:
-                self._client.save_replay_buffer()
+                await asyncio.to_thread(self._client.save_replay_buffer)
                 log.info("[OBS] Replay buffer saved")
             except Exception as e:
                 log.error(f"[OBS] SaveReplayBuffer failed: {e}")
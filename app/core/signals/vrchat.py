@@ -1,35 +1,98 @@
 import asyncio
-import json
 import logging
+import socket
 from pathlib import Path
-from typing import Dict, Any, List
-from pythonosc.udp_client import SimpleUDPClient
+from typing import Any, Dict, List, Tuple
+from pythonosc.osc_message_builder import OscMessageBuilder
 from .base import Signal, BaseSignalHandler
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
+
 log = logging.getLogger("pixel.vrchat")
 
+# Validated, pre-coerced action tuples:
+#   ("pulse", duration, packet_on, packet_off)
+#   ("value", packet, None, None)
+_Action = Tuple[str, Any, Any, Any]
+
+
+def _build_dgram(address: str, value: Any) -> bytes:
+    b = OscMessageBuilder(address=address)
+    b.add_arg(value)
+    return b.build().dgram
+
+
 class VRChatOSCHandler(BaseSignalHandler):
     def __init__(self, host: str, port: int, mapping_path: Path | None):
-        self._client = SimpleUDPClient(host, port)
-        self._mappings: Dict[str, List[Dict[str, Any]]] = {}
+        # Fixed target, one shared transport; per-send client/address
+        # resolution is pure overhead at signal rates. The asyncio datagram
+        # transport is created lazily on first use (init happens outside the
+        # loop) and its sendto never blocks, even on a congested link.
+        self._addr = (host, port)
+        self._transport: asyncio.DatagramTransport | None = None
+        self._mappings: Dict[str, List[_Action]] = {}
         if mapping_path and mapping_path.exists():
             try:
-                self._mappings = json.loads(mapping_path.read_text())
+                self._mappings = self._compile_mappings(_json.loads(mapping_path.read_bytes()))
                 log.info("[VRC] Loaded OSC signal mappings")
             except Exception as e:
                 log.error(f"[VRC] Failed to load mapping file: {e}")
 
+    @staticmethod
+    def _compile_mappings(data: Dict[str, Any]) -> Dict[str, List[_Action]]:
+        """Validate once at load: coerce types, serialize OSC datagrams.
+
+        handle() then just unpacks tuples and sends bytes — no dict.get or
+        float() per fired signal. Malformed actions are dropped with a log
+        line instead of failing at runtime.
+        """
+        compiled: Dict[str, List[_Action]] = {}
+        for name, actions in (data or {}).items():
+            out: List[_Action] = []
+            for action in actions or []:
+                try:
+                    addr = action["address"]
+                    typ = action["type"]
+                    if typ == "pulse":
+                        duration = float(action.get("duration", 0.25))
+                        out.append(("pulse", duration, _build_dgram(addr, True), _build_dgram(addr, False)))
+                    elif typ in ("bool", "int", "float"):
+                        out.append(("value", _build_dgram(addr, action["value"]), None, None))
+                    else:
+                        log.warning(f"[VRC] Unknown action type {typ!r} for {name}")
+                except Exception as e:
+                    log.warning(f"[VRC] Skipping bad action for {name}: {e}")
+            if out:
+                compiled[name] = out
+        return compiled
+
+    async def _get_transport(self) -> asyncio.DatagramTransport:
+        if self._transport is None or self._transport.is_closing():
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setblocking(False)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            except OSError:
+                pass
+            sock.connect(self._addr)
+            loop = asyncio.get_running_loop()
+            self._transport, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, sock=sock
+            )
+        return self._transport
+
     async def handle(self, signal: Signal) -> None:
         actions = self._mappings.get(signal.name)
         if not actions:
             return
-        for action in actions:
-            addr = action["address"]
-            typ = action["type"]
-            if typ == "pulse":
-                duration = float(action.get("duration", 0.25))
-                self._client.send_message(addr, True)
-                await asyncio.sleep(duration)
-                self._client.send_message(addr, False)
-            elif typ in ("bool", "int", "float"):
-                self._client.send_message(addr, action["value"])
+        transport = await self._get_transport()
+        for kind, a, b, c in actions:
+            if kind == "pulse":
+                transport.sendto(b)
+                await asyncio.sleep(a)
+                transport.sendto(c)
+            else:
+                transport.sendto(a)
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from sqlalchemy import select
+import time
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -17,8 +18,9 @@ class TTSService:
         self.bus = bus
 
     def pending_count(self) -> int:
-        stmt = select(QueueItem).where(QueueItem.kind == 'tts', QueueItem.status == 'pending')
-        return len(list(self.db.scalars(stmt)))
+        # Count in the DB; no reason to hydrate every pending row for a number
+        stmt = select(func.count(QueueItem.id)).where(QueueItem.kind == 'tts', QueueItem.status == 'pending')
+        return int(self.db.scalar(stmt) or 0)
 
     def _build_text(self, payload: dict) -> str:
         msg = (payload.get('message') or '').strip()
@@ -46,39 +48,59 @@ class TTSService:
         )
         if running:
             payload = running.payload_json or {}
-            primed_at_str = payload.get('primed_at')
-            if primed_at_str:
+            # primed_mono is a monotonic float — the elapsed check is a
+            # subtraction, no ISO timestamp parsing. Fall back to the legacy
+            # primed_at string for items claimed by an older build.
+            elapsed = None
+            primed_mono = payload.get('primed_mono')
+            if primed_mono is not None:
+                elapsed = time.monotonic() - float(primed_mono)
+                if elapsed < 0:
+                    # monotonic clock from a previous boot; treat as ready
+                    # rather than wedging the queue
+                    elapsed = delay
+            elif payload.get('primed_at'):
                 try:
-                    primed_at = datetime.fromisoformat(primed_at_str)
+                    primed_at = datetime.fromisoformat(payload['primed_at'])
                 except Exception:
                     primed_at = now
-                if (now - primed_at).total_seconds() >= (int(self.settings.TTS_PRE_DELAY_MS)/1000.0):
-                    text = self._build_text(payload)
-                    running.status = 'done'
-                    running.finished_at = now
-                    self.db.commit()
-                    return text
+                elapsed = (now - primed_at).total_seconds()
+            if elapsed is not None and elapsed >= delay:
+                text = self._build_text(payload)
+                running.status = 'done'
+                running.finished_at = now
+                self.db.commit()
+                return text
             return ''
 
-        pending = self.db.scalar(
-            select(QueueItem)
+        # Claim the FIFO head in one atomic UPDATE ... RETURNING: the guarded
+        # status='pending' check means a concurrent poller can't double-claim.
+        # (SQLite has no SKIP LOCKED; its single-writer model plus this guard
+        # gives the same effect for our one-process setup.)
+        head = (
+            select(QueueItem.id)
             .where(QueueItem.kind == 'tts', QueueItem.status == 'pending')
             .order_by(QueueItem.id.asc())
             .limit(1)
+            .scalar_subquery()
         )
-        if not pending:
+        claimed = self.db.execute(
+            update(QueueItem)
+            .where(QueueItem.id == head, QueueItem.status == 'pending')
+            .values(
+                status='running',
+                started_at=now,
+                payload_json=func.json_set(QueueItem.payload_json, '$.primed_mono', time.monotonic()),
+            )
+            .returning(QueueItem.id)
+        ).scalar_one_or_none()
+        if claimed is None:
             return ''
-
-        payload = dict(pending.payload_json or {})
-        payload['primed_at'] = now.isoformat()
-        pending.payload_json = payload
-        pending.status = 'running'
-        pending.started_at = now
         self.db.commit()
 
         try:
             if self.settings.TTS_PRE_SOUND:
-                await play_sfx(self.bus, self.settings.TTS_PRE_SOUND)
+                play_sfx(self.bus, self.settings.TTS_PRE_SOUND)
         except Exception:
             pass
 
@@ -1,12 +1,27 @@
 from __future__ import annotations
-import json, random
+import itertools, json, random
+from bisect import bisect
 from pathlib import Path
 from typing import Any
 
 from app.core.config import Settings
 
 
-DEFAULT_PRIZES: list[dict[str, Any]] = [
+class _PrizeList(list):
+    """Prize list carrying its precomputed cumulative weights.
+
+    Built once when the file is (re)parsed, so per-spin selection doesn't
+    re-walk the weights.
+    """
+
+    __slots__ = ("cum_weights",)
+
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        super().__init__(items)
+        self.cum_weights = list(itertools.accumulate(max(1, int(it.get("weight", 1))) for it in items))
+
+
+_RAW_DEFAULT_PRIZES: list[dict[str, Any]] = [
     {"name": "50 Points", "weight": 30},
     {"name": "100 Points", "weight": 20},
     {"name": "Confetti Blast", "weight": 15},
@@ -14,15 +29,39 @@ DEFAULT_PRIZES: list[dict[str, Any]] = [
     {"name": "Streamer Compliment", "weight": 10},
     {"name": "Mystery Prize", "weight": 10},
 ]
+DEFAULT_PRIZES: _PrizeList = _PrizeList(_RAW_DEFAULT_PRIZES)
+
+
+# Parsed-file cache: path -> (mtime_ns, size, parsed). Spin lines and prizes
+# are read on every wheel spin but edited rarely; a hit costs one stat.
+# Cached values are shared — callers must not mutate them.
+_JSON_CACHE: dict[str, tuple[int, int, Any]] = {}
+
+
+def _cache_get(path: Path) -> tuple[str, tuple[int, int] | None, Any]:
+    key = str(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return key, None, None
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return key, (st.st_mtime_ns, st.st_size), cached[2]
+    return key, (st.st_mtime_ns, st.st_size), None
 
 
 def _read_lines(path: Path) -> list[str]:
+    key, stamp, hit = _cache_get(path)
+    if hit is not None:
+        return hit
     try:
         txt = path.read_text(encoding="utf-8")
-        lines = [l.strip() for l in txt.splitlines() if l.strip()]
-        return lines or [""]
+        lines = [l.strip() for l in txt.splitlines() if l.strip()] or [""]
     except Exception:
         return [""]
+    if stamp is not None:
+        _JSON_CACHE[key] = (*stamp, lines)
+    return lines
 
 
 def load_spin_lines(settings: Settings) -> list[str]:
@@ -35,7 +74,10 @@ def load_prize_lines(settings: Settings) -> list[str]:
 
 def load_prizes(settings: Settings) -> list[dict[str, Any]]:
     p = Path(settings.PRIZES_FILE)
-    if not p.exists():
+    key, stamp, hit = _cache_get(p)
+    if hit is not None:
+        return hit
+    if stamp is None:  # missing file
         return DEFAULT_PRIZES
     try:
         data = json.loads(p.read_text(encoding="utf-8"))
@@ -51,12 +93,19 @@ def load_prizes(settings: Settings) -> list[dict[str, Any]]:
             obj["name"] = name
             obj["weight"] = max(1, weight)
             items.append(obj)
-        return items or DEFAULT_PRIZES
+        items = _PrizeList(items) if items else DEFAULT_PRIZES
+        _JSON_CACHE[key] = (*stamp, items)
+        return items
     except Exception:
         return DEFAULT_PRIZES
 
 
 def weighted_choice_index(items: list[dict[str, Any]]) -> int:
-    weights = [max(1, int(it.get("weight", 1))) for it in items]
-    idx = random.choices(range(len(items)), weights=weights, k=1)[0]
-    return int(idx)
+    # Prize lists from load_prizes carry precomputed cumulative weights;
+    # fall back to a one-off accumulate for plain lists.
+    cum = getattr(items, "cum_weights", None)
+    if cum is None:
+        cum = list(itertools.accumulate(max(1, int(it.get("weight", 1))) for it in items))
+    # Single weighted pick: one C-level bisect over the cached cumulative
+    # weights, without random.choices' per-call validation and list build.
+    return bisect(cum, random.random() * cum[-1])
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any
 
 from sqlalchemy import select
@@ -11,9 +11,68 @@ from app.core.config import Settings
 from app.core.cooldowns import CooldownService
 from app.core.models import User, XP, XPTransaction, QueueItem
 from app.core.points import PointsService
-from app.core.xp_curve import level_from_xp, progress_to_next_level
+from app.core.xp_curve import _level_from_xp_fast, level_from_xp, progress_to_next_level
 from app.core.xp_policy import XpEvent, normalize_event_type
-from app.core.level_rewards import apply_level_rewards
+from app.core.level_rewards import apply_level_rewards, load_level_rewards
+
+
+# In-process cooldown mirror: (user_lower, cooldown_key) -> monotonic expiry.
+# Chat XP is cooldown-rejected for most messages from an active chatter;
+# checking here first skips the ensure-user round trips for that common case.
+# The DB cooldown row stays authoritative (this survives nothing).
+_CD_CACHE: dict[tuple[str, str], float] = {}
+_CD_CACHE_MAX = 4096
+
+
+def _cd_cache_put(key: tuple[str, str], expires: float) -> None:
+    if len(_CD_CACHE) >= _CD_CACHE_MAX:
+        now = time.monotonic()
+        for k in [k for k, v in _CD_CACHE.items() if v <= now]:
+            del _CD_CACHE[k]
+    _CD_CACHE[key] = expires
+
+
+# Event config table: et -> (base amount (or per-token rate for tip),
+# cooldown seconds, cooldown key). Built once per settings object so
+# handle_event is a dict lookup instead of a getattr/int/or chain per event.
+_EVENT_TABLE: tuple[int, dict[str, tuple[float, int, str]]] | None = None
+
+
+def _event_table(settings: Settings) -> dict[str, tuple[float, int, str]]:
+    global _EVENT_TABLE
+    cached = _EVENT_TABLE
+    sid = id(settings)
+    if cached is not None and cached[0] == sid:
+        return cached[1]
+    table = {
+        "chat": (
+            int(getattr(settings, "XP_CHAT_AMOUNT", 1) or 1),
+            int(getattr(settings, "XP_CHAT_COOLDOWN_SECONDS", 30) or 30),
+            "xp:chat",
+        ),
+        "follow": (
+            int(getattr(settings, "XP_FOLLOW_AMOUNT", 10) or 10),
+            int(getattr(settings, "XP_FOLLOW_COOLDOWN_SECONDS", 3600) or 3600),
+            "xp:follow",
+        ),
+        "sub": (
+            int(getattr(settings, "XP_SUB_AMOUNT", 50) or 50),
+            int(getattr(settings, "XP_SUB_COOLDOWN_SECONDS", 3600) or 3600),
+            "xp:sub",
+        ),
+        "tip": (
+            float(getattr(settings, "XP_TIP_PER_TOKEN", 0.1) or 0.1),
+            int(getattr(settings, "XP_TIP_COOLDOWN_SECONDS", 30) or 30),
+            "xp:tip",
+        ),
+        "dropin": (
+            int(getattr(settings, "XP_DROPIN_AMOUNT", 5) or 5),
+            int(getattr(settings, "XP_DROPIN_COOLDOWN_SECONDS", 3600) or 3600),
+            "xp:dropin",
+        ),
+    }
+    _EVENT_TABLE = (sid, table)
+    return table
 
 
 @dataclass(frozen=True)
@@ -37,8 +96,10 @@ class XpService:
         self.points = PointsService(db)
         self.cooldowns = CooldownService(db)
 
-    def ensure_user_xp(self, user_name: str) -> tuple[User, XP]:
-        u = self.points.ensure_user(user_name)
+    def ensure_user_xp(self, user_name: str, *, user: User | None = None) -> tuple[User, XP]:
+        # Callers that already hold the User row pass it in to skip the
+        # ensure_user lookup.
+        u = user if user is not None else self.points.ensure_user(user_name)
         xp = self.db.get(XP, u.id)
         if xp is None:
             xp = XP(user_id=u.id, total_xp=0, level=1)
@@ -46,8 +107,8 @@ class XpService:
             self.db.commit()
         return u, xp
 
-    def get_progress_text(self, user_name: str) -> str:
-        u, xp = self.ensure_user_xp(user_name)
+    def get_progress_text(self, user_name: str, *, user: User | None = None) -> str:
+        u, xp = self.ensure_user_xp(user_name, user=user)
         base = int(getattr(self.settings, "XP_BASE", 100) or 100)
         exponent = float(getattr(self.settings, "XP_EXPONENT", 1.8) or 1.8)
         into, required, ratio = progress_to_next_level(xp.total_xp, xp.level, base=base, exponent=exponent)
@@ -68,42 +129,37 @@ class XpService:
             return None
 
         # Map event → xp amount + cooldown key
-        if et == "chat":
-            amount = int(getattr(self.settings, "XP_CHAT_AMOUNT", 1) or 1)
-            cd = int(getattr(self.settings, "XP_CHAT_COOLDOWN_SECONDS", 30) or 30)
-            cooldown_key = "xp:chat"
-        elif et == "follow":
-            amount = int(getattr(self.settings, "XP_FOLLOW_AMOUNT", 10) or 10)
-            cd = int(getattr(self.settings, "XP_FOLLOW_COOLDOWN_SECONDS", 3600) or 3600)
-            cooldown_key = "xp:follow"
-        elif et == "sub":
+        cfg = _event_table(self.settings).get(et)
+        if cfg is None:
+            return None
+        base_amt, cd, cooldown_key = cfg
+
+        if et == "sub":
             months = int(event.metadata.get("months", 1) or 1)
-            base_amt = int(getattr(self.settings, "XP_SUB_AMOUNT", 50) or 50)
-            amount = max(0, base_amt * max(1, months))
-            cd = int(getattr(self.settings, "XP_SUB_COOLDOWN_SECONDS", 3600) or 3600)
-            cooldown_key = "xp:sub"
+            amount = max(0, int(base_amt) * max(1, months))
         elif et == "tip":
             tokens = int(event.metadata.get("tokens", 0) or 0)
-            per = float(getattr(self.settings, "XP_TIP_PER_TOKEN", 0.1) or 0.1)
-            amount = int(tokens * per)
-            cd = int(getattr(self.settings, "XP_TIP_COOLDOWN_SECONDS", 30) or 30)
-            cooldown_key = "xp:tip"
-        elif et == "dropin":
-            amount = int(getattr(self.settings, "XP_DROPIN_AMOUNT", 5) or 5)
-            cd = int(getattr(self.settings, "XP_DROPIN_COOLDOWN_SECONDS", 3600) or 3600)
-            cooldown_key = "xp:dropin"
+            amount = int(tokens * base_amt)
         else:
-            return None
+            amount = int(base_amt)
 
         if amount <= 0:
             return None
 
+        # Cheap in-memory rejection before any DB work
+        cache_key = (user.lower(), cooldown_key)
+        if cd > 0:
+            expires = _CD_CACHE.get(cache_key)
+            if expires is not None and expires > time.monotonic():
+                return None
+
         u, xp = self.ensure_user_xp(user)
 
-        # cooldown check
+        # cooldown check (authoritative)
         if cd > 0:
-            active, _remaining = self.cooldowns.is_active(u.id, cooldown_key)
+            active, remaining = self.cooldowns.is_active(u.id, cooldown_key)
             if active:
+                _cd_cache_put(cache_key, time.monotonic() + remaining)
                 return None
 
         result = self._award(u, xp, amount, reason=et, source=event.source, bypass_cooldown=True)
@@ -111,6 +167,7 @@ class XpService:
         # Set cooldown after successful award
         if result.ok and cd > 0:
             self.cooldowns.set(u.id, cooldown_key, cd)
+            _cd_cache_put(cache_key, time.monotonic() + cd)
 
         return result
 
@@ -144,39 +201,52 @@ class XpService:
 
         base = int(getattr(self.settings, "XP_BASE", 100) or 100)
         exponent = float(getattr(self.settings, "XP_EXPONENT", 1.8) or 1.8)
-        new_level = int(level_from_xp(new_total, base=base, exponent=exponent, max_level=int(getattr(self.settings, "XP_MAX_LEVEL", 9999) or 9999)))
+        max_level = int(getattr(self.settings, "XP_MAX_LEVEL", 9999) or 9999)
+        if base == 100 and exponent == 1.8:
+            # hot path: inputs are already sanitized ints here
+            new_level = _level_from_xp_fast(new_total, max_level)
+        else:
+            new_level = int(level_from_xp(new_total, base=base, exponent=exponent, max_level=max_level))
 
         xp.total_xp = int(new_total)
         xp.level = int(new_level)
         self.db.add(xp)
 
-        tx = XPTransaction(user_id=user.id, delta=int(delta), reason=str(reason or ""), source=str(source or ""), created_at=datetime.utcnow())
+        # created_at comes from the column default; no extra clock read here
+        tx = XPTransaction(user_id=user.id, delta=int(delta), reason=str(reason or ""), source=str(source or ""))
         self.db.add(tx)
 
         reward_actions: list[dict[str, Any]] = []
         # Apply any rewards for each level crossed (e.g. jumping multiple levels)
-        rewards_file = getattr(self.settings, "XP_LEVEL_REWARDS_FILE", "./data/level_rewards.json")
         if int(new_level) > int(before_level):
+            rewards_file = getattr(self.settings, "XP_LEVEL_REWARDS_FILE", "./data/level_rewards.json")
+            rewards = load_level_rewards(rewards_file)
+            # apply_level_rewards defers its commits; collect TTS lines from
+            # every crossed level and add them in one batch so a multi-level
+            # jump still flushes/commits once.
+            tts_items: list[QueueItem] = []
             for lvl in range(before_level + 1, new_level + 1):
                 acts = apply_level_rewards(
                     self.db,
                     user_id=user.id,
                     user_name=user.name,
                     new_level=lvl,
-                    rewards_path=rewards_file,
+                    rewards=rewards,
                 )
                 reward_actions.extend(acts)
 
                 # If a reward requests a TTS line, enqueue it.
-                for a in acts:
-                    if a.get("type") == "tts":
-                        self.db.add(
-                            QueueItem(
-                                kind="tts",
-                                status="pending",
-                                payload_json={"user": user.name, "message": str(a.get("text", "")), "prefix": False, "source": "level"},
-                            )
-                        )
+                tts_items.extend(
+                    QueueItem(
+                        kind="tts",
+                        status="pending",
+                        payload_json={"user": user.name, "message": str(a.get("text", "")), "prefix": False, "source": "level"},
+                    )
+                    for a in acts
+                    if a.get("type") == "tts"
+                )
+            if tts_items:
+                self.db.add_all(tts_items)
 
         self.db.commit()
 
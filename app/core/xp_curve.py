@@ -1,6 +1,62 @@
 from __future__ import annotations
 
 import math
+import os
+from bisect import bisect_right
+from functools import lru_cache
+
+# numpy is optional: the table below works as a plain list, numpy just makes
+# batch lookups (leaderboards) a single C call.
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None
+
+# numba is optional too: when installed, the scalar threshold kernel is
+# jit-compiled (cached to disk); otherwise the decorator is a no-op and the
+# plain-Python kernel runs.
+try:
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover
+    def _njit(**_kwargs):
+        def wrap(f):
+            return f
+        return wrap
+
+_DEFAULT_BASE = 100
+_DEFAULT_EXPONENT = 1.8
+_DEFAULT_MAX_LEVEL = 9999
+
+# Precomputed thresholds for the default curve: index L-1 holds the
+# cumulative XP for level L, for levels 1..10000 (~80 KB). Lookups and
+# inversions on the default curve then never touch pow at all.
+_PRECOMPUTE = os.getenv("PIXEL_XP_PRECOMPUTE", "1") == "1"
+
+_THRESH = None
+_THRESH_LIST: list[int] | None = None
+if _PRECOMPUTE:
+    if _np is not None:
+        _THRESH = _np.floor(
+            float(_DEFAULT_BASE)
+            * _np.arange(0, _DEFAULT_MAX_LEVEL + 1, dtype=_np.float64) ** _DEFAULT_EXPONENT
+        ).astype(_np.int64)
+        _THRESH_LIST = _THRESH.tolist()
+    else:
+        # int() truncates toward zero, which equals floor for these
+        # non-negative values — no separate math.floor call needed
+        _THRESH_LIST = [0] + [
+            int(float(_DEFAULT_BASE) * math.pow(L, _DEFAULT_EXPONENT))
+            for L in range(1, _DEFAULT_MAX_LEVEL + 1)
+        ]
+
+
+# Most active chatters sit well below level 64; a tiny tuple keeps their
+# threshold lookups a single BINARY_SUBSCR even when the big table is
+# disabled. Built with the same formula as the table so the two agree.
+_SMALL_THRESH = tuple(
+    0 if L <= 1 else int(float(_DEFAULT_BASE) * math.pow(L - 1, _DEFAULT_EXPONENT))
+    for L in range(0, 65)
+)
 
 
 def xp_total_for_level(level: int, *, base: int = 100, exponent: float = 1.8) -> int:
@@ -11,37 +67,189 @@ def xp_total_for_level(level: int, *, base: int = 100, exponent: float = 1.8) ->
     Curve:
       total_xp(level) = base * (level-1)^exponent
 
-    Returns an integer (floored).
+    Returns an integer (floored). Pure function of its arguments, so values
+    are memoized — level inversion and progress rendering re-query the same
+    handful of levels constantly.
     """
     lvl = max(1, int(level))
     if lvl <= 1:
         return 0
-    return int(math.floor(float(base) * math.pow(lvl - 1, float(exponent))))
+    if base == _DEFAULT_BASE and exponent == _DEFAULT_EXPONENT:
+        if lvl < 65:
+            return _SMALL_THRESH[lvl]
+        if _THRESH_LIST is not None and lvl <= _DEFAULT_MAX_LEVEL + 1:
+            return _THRESH_LIST[lvl - 1]
+    return _xp_total_cached(lvl, int(base), float(exponent))
+
+
+@_njit(cache=True)
+def _xp_total_kernel(lvl: int, base: float, exponent: float) -> float:
+    # Generic pow, deliberately: exp2(e*log2 x) rounds exact powers a hair
+    # low (7*5**1.0 -> 34.999…) and the caller's int() truncation turns that
+    # into a wrong level boundary. The exp2 spelling stays confined to the
+    # inversion estimates, where the bracket check absorbs rounding. No
+    # fastmath: the jit win is compiling the call, and relaxed FP semantics
+    # have no business in a truncated load-bearing result.
+    return base * math.pow(lvl - 1, exponent)
+
+
+@lru_cache(maxsize=8192)
+def _xp_total_cached(lvl: int, base: int, exponent: float) -> int:
+    return int(_xp_total_kernel(lvl, float(base), exponent))
+
+
+# Pre-warm so the first real request doesn't pay the jit compile (no-op
+# without numba).
+_xp_total_kernel(2, 100.0, 1.8)
 
 
 def level_from_xp(total_xp: int, *, base: int = 100, exponent: float = 1.8, max_level: int = 9999) -> int:
     """Compute current level from cumulative XP.
 
-    This uses a fast approximation and then corrects by stepping.
+    The default curve binary-searches the precomputed table; other curves
+    bisect a lazily-built table for their parameters. With precompute
+    disabled, falls back to inverting the curve and bracket-correcting.
     """
     tx = max(0, int(total_xp))
     if tx <= 0:
         return 1
 
+    # Default curve: one binary search over the precomputed table, no pow
+    if (
+        _THRESH_LIST is not None
+        and base == _DEFAULT_BASE
+        and exponent == _DEFAULT_EXPONENT
+        and max_level <= _DEFAULT_MAX_LEVEL
+    ):
+        return min(bisect_right(_THRESH_LIST, tx), int(max_level))
+
     b = max(1, int(base))
     e = max(0.25, float(exponent))
+    ml = max(1, int(max_level))
+
+    if _PRECOMPUTE:
+        return max(1, min(bisect_right(_param_thresholds(b, e, ml), tx), ml))
+    if b == _DEFAULT_BASE and e == _DEFAULT_EXPONENT:
+        return _level_from_xp_default_inverted(tx, ml)
+    return _level_from_xp_inverted(tx, b, e, ml)
+
+
+def _xp_total_for_level_fast(lvl: int) -> int:
+    """Default-curve threshold, no argument validation.
+
+    For trusted internal callers (event ingest, batch renderers) that already
+    hold a sane int level; external boundaries use xp_total_for_level.
+    """
+    if lvl <= 1:
+        return 0
+    if lvl < 65:
+        return _SMALL_THRESH[lvl]
+    if _THRESH_LIST is not None and lvl <= _DEFAULT_MAX_LEVEL + 1:
+        return _THRESH_LIST[lvl - 1]
+    return _xp_total_cached(lvl, _DEFAULT_BASE, _DEFAULT_EXPONENT)
+
+
+def _level_from_xp_fast(tx: int, max_level: int = _DEFAULT_MAX_LEVEL) -> int:
+    """Default-curve level lookup, no argument validation (see above)."""
+    if tx <= 0:
+        return 1
+    if _THRESH_LIST is not None and max_level <= _DEFAULT_MAX_LEVEL:
+        return min(bisect_right(_THRESH_LIST, tx), max_level)
+    return _level_from_xp_default_inverted(tx, max_level)
+
+
+# Constants for the default-curve inversion, folded at import:
+# (tx/b)^(1/e) == exp2(log2(tx)/e - log2(b)/e), so the hot path is one log2,
+# one fused multiply-subtract and one exp2 — no division, no generic pow.
+_INV_E_DEFAULT = 1.0 / _DEFAULT_EXPONENT
+_LOG2_B_OVER_E_DEFAULT = math.log2(float(_DEFAULT_BASE)) * _INV_E_DEFAULT
+
+
+def _level_from_xp_default_inverted(tx: int, max_level: int) -> int:
+    """Inversion specialized to base=100/exponent=1.8 (no table).
+
+    Works in log space with precomputed constants before the bracket check.
+    """
+    approx = 1 + int(math.exp2(math.log2(tx) * _INV_E_DEFAULT - _LOG2_B_OVER_E_DEFAULT))
+    lvl = max(1, min(approx, max_level))
+
+    if lvl < max_level and _xp_total_for_level_fast(lvl + 1) <= tx:
+        lvl += 1
+    elif _xp_total_for_level_fast(lvl) > tx:
+        lvl -= 1
+
+    return max(1, lvl)
 
-    # Invert: tx = b*(L-1)^e  =>  L = 1 + (tx/b)^(1/e)
-    approx = 1 + int(math.floor(math.pow(tx / b, 1.0 / e)))
+
+# Lazily-built threshold tables for non-default curves (in practice at most
+# one custom parameter set per deployment).
+_PARAM_TABLES: dict[tuple[int, float, int], list[int]] = {}
+
+
+def _param_thresholds(base: int, exponent: float, max_level: int) -> list[int]:
+    key = (base, exponent, max_level)
+    tbl = _PARAM_TABLES.get(key)
+    if tbl is None:
+        if len(_PARAM_TABLES) >= 8:
+            _PARAM_TABLES.clear()
+        tbl = [xp_total_for_level(L, base=base, exponent=exponent) for L in range(1, max_level + 1)]
+        _PARAM_TABLES[key] = tbl
+    return tbl
+
+
+def _level_from_xp_inverted(tx: int, b: int, e: float, max_level: int) -> int:
+    # Invert: tx = b*(L-1)^e  =>  L = 1 + (tx/b)^(1/e), via exp2/log2
+    # (tx > 0 here, so the log is defined), then bracket-correct: flooring a
+    # monotonic power inversion is off by at most one level on real curves.
+    approx = 1 + int(math.exp2(math.log2(tx / b) / e))
     lvl = max(1, min(int(approx), int(max_level)))
 
-    # Correct off-by-a-few errors caused by flooring.
-    while lvl < max_level and xp_total_for_level(lvl + 1, base=b, exponent=e) <= tx:
+    if lvl < max_level and xp_total_for_level(lvl + 1, base=b, exponent=e) <= tx:
         lvl += 1
-    while lvl > 1 and xp_total_for_level(lvl, base=b, exponent=e) > tx:
+        if lvl < max_level and xp_total_for_level(lvl + 1, base=b, exponent=e) <= tx:
+            # Degenerate curves (tiny base / sub-linear exponent) floor many
+            # levels onto the same threshold; bisect the remainder.
+            lvl = _bsearch_level(tx, lvl, int(max_level), b, e)
+    elif xp_total_for_level(lvl, base=b, exponent=e) > tx:
         lvl -= 1
+        if lvl > 1 and xp_total_for_level(lvl, base=b, exponent=e) > tx:
+            lvl = _bsearch_level(tx, 1, lvl, b, e)
+
+    return max(1, lvl)
+
+
+def levels_from_xp_batch(totals, *, base: int = 100, exponent: float = 1.8, max_level: int = 9999):
+    """Vectorized level lookup for leaderboard-style workloads.
+
+    On the default curve with numpy installed this is one searchsorted call
+    over the precomputed table; otherwise it falls back to per-value lookups.
+    Returns a list of ints (a numpy int64 array when numpy does the work).
+    """
+    if (
+        _np is not None
+        and _THRESH is not None
+        and base == _DEFAULT_BASE
+        and exponent == _DEFAULT_EXPONENT
+        and max_level <= _DEFAULT_MAX_LEVEL
+    ):
+        tx = _np.maximum(_np.asarray(totals, dtype=_np.int64), 0)
+        lvls = _np.searchsorted(_THRESH, tx, side="right")
+        return _np.minimum(lvls, max_level).astype(_np.int64)
+    if base == _DEFAULT_BASE and exponent == _DEFAULT_EXPONENT:
+        ml = int(max_level)
+        return [_level_from_xp_fast(int(t), ml) for t in totals]
+    return [level_from_xp(t, base=base, exponent=exponent, max_level=max_level) for t in totals]
+
 
-    return lvl
+def _bsearch_level(tx: int, lo: int, hi: int, base: int, exponent: float) -> int:
+    """Largest level in [lo, hi] whose threshold is <= tx."""
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if xp_total_for_level(mid, base=base, exponent=exponent) <= tx:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
 
 
 def progress_to_next_level(total_xp: int, level: int, *, base: int = 100, exponent: float = 1.8) -> tuple[int, int, float]:
@@ -49,9 +257,27 @@ def progress_to_next_level(total_xp: int, level: int, *, base: int = 100, expone
     lvl = max(1, int(level))
     tx = max(0, int(total_xp))
 
-    cur_threshold = xp_total_for_level(lvl, base=base, exponent=exponent)
-    next_threshold = xp_total_for_level(lvl + 1, base=base, exponent=exponent)
-    required = max(1, int(next_threshold - cur_threshold))
-    into = max(0, int(tx - cur_threshold))
-    ratio = min(1.0, max(0.0, into / required))
+    # Adjacent levels are neighbouring slots in the precomputed table — no
+    # pow at all for the default curve.
+    if (
+        _THRESH_LIST is not None
+        and base == _DEFAULT_BASE
+        and exponent == _DEFAULT_EXPONENT
+        and lvl <= _DEFAULT_MAX_LEVEL
+    ):
+        cur_threshold = _THRESH_LIST[lvl - 1]
+        next_threshold = _THRESH_LIST[lvl]
+    else:
+        cur_threshold = xp_total_for_level(lvl, base=base, exponent=exponent)
+        next_threshold = xp_total_for_level(lvl + 1, base=base, exponent=exponent)
+    # Conditional expressions instead of min/max builtin calls; thresholds
+    # and tx are already ints here.
+    required = next_threshold - cur_threshold
+    if required < 1:
+        required = 1
+    into = tx - cur_threshold
+    if into < 0:
+        into = 0
+    r = into / required
+    ratio = 0.0 if r < 0.0 else (1.0 if r > 1.0 else r)
     return into, required, ratio
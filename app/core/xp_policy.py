@@ -1,32 +1,58 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
+# Shared read-only mapping for events that carry no metadata (follow/dropin),
+# saving a dict allocation per event.
+EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
-class XpEvent:
+
+class XpEvent(NamedTuple):
     """Stable internal event format for XP.
 
     Producers (Joystick ingest, sim console, future VRChat OSC) should emit this.
     The XP system consumes it without caring where it came from.
+
+    A NamedTuple rather than a dataclass: one is allocated per ingested
+    message, and tuples carry no per-instance __dict__.
     """
 
     type: str  # chat|follow|sub|tip|dropin
     user: str
-    metadata: Dict[str, Any]
+    metadata: Mapping[str, Any] = EMPTY_METADATA
     source: str = "joystick"  # joystick|sim|admin
 
 
+# Canonical event types, pre-interned: the common case returns the shared
+# module-level string, so downstream equality checks are pointer compares.
+_CANON = {t: t for t in ("chat", "follow", "sub", "tip", "dropin")}
+
+
 def normalize_event_type(t: str) -> str:
-    return (t or "").strip().lower()
+    s = (t or "").strip().lower()
+    canon = _CANON.get(s)
+    if canon is not None:
+        return canon
+    # unknown types still dedup across repeats
+    return sys.intern(s)
 
 
 def is_xp_eligible_chat(text: str, *, min_len: int = 1) -> bool:
-    msg = (text or "").strip()
-    if not msg:
+    if not text:
+        return False
+    # Scan past leading whitespace without building a stripped copy — most
+    # chat has none, and this runs once per ingested message.
+    i = 0
+    n = len(text)
+    while i < n and text[i] in " \t\r\n":
+        i += 1
+    if i == n:
         return False
     # Commands don't generate passive XP.
-    if msg.startswith("!"):
+    if text[i] == "!":
         return False
-    return len(msg) >= max(1, int(min_len))
+    while n > i and text[n - 1] in " \t\r\n":
+        n -= 1
+    return (n - i) >= max(1, int(min_len))
@@ -1,13 +1,17 @@
 from __future__ import annotations
-import uvicorn
 from app.admin.server import create_app
-from app.core.config import Settings
+from app.core.config import get_settings
 from app.core.db import bootstrap
 
 
 def main() -> None:
-    settings = Settings()  # loads from env/.env
-    bootstrap()
+    # uvicorn is a heavy import (httptools, websockets); defer it until we
+    # actually serve
+    import uvicorn
+
+    settings = get_settings()  # loads from env/.env
+    if settings.DB_BOOTSTRAP:
+        bootstrap()
     app = create_app(settings)
     uvicorn.run(
         app,